@@ -14,16 +14,17 @@ Auth: JWT via POST /api/Login/AuthenticateClient
 import json
 import logging
 import os
-import re
 import time
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 from uuid import uuid4
 
 import httpx
 
+from app.adapters.http import get_http_client
+
 # Configure logging
 logger = logging.getLogger("datatree")
 logger.setLevel(logging.DEBUG)
@@ -281,17 +282,17 @@ class DataTreeClient:
         if self._token and time.time() < self._token_expires:
             return self._token
 
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.post(
-                f"{self.config.base_url}/api/Login/AuthenticateClient",
-                json={
-                    "ClientId": self.config.client_id,
-                    "ClientSecretKey": self.config.client_secret,
-                },
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client().post(
+            f"{self.config.base_url}/api/Login/AuthenticateClient",
+            json={
+                "ClientId": self.config.client_id,
+                "ClientSecretKey": self.config.client_secret,
+            },
+            headers={"Content-Type": "application/json"},
+            timeout=self.config.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         # Extract token — response is a plain JWT string, or {"Token": "...", ...}
         if isinstance(data, str):
@@ -317,31 +318,31 @@ class DataTreeClient:
         logger.debug("Request body: %s", json.dumps(body, default=str)[:500])
 
         start_time = time.time()
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.post(
-                f"{self.config.base_url}{endpoint}",
-                json=body,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {token}",
-                },
+        response = await get_http_client().post(
+            f"{self.config.base_url}{endpoint}",
+            json=body,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {token}",
+            },
+            timeout=self.config.timeout,
+        )
+        elapsed = time.time() - start_time
+
+        logger.debug("Response status: %d (%.2fs)", response.status_code, elapsed)
+
+        if response.status_code != 200:
+            error_text = response.text[:500]
+            logger.error("API error %d: %s", response.status_code, error_text)
+            # Include error details in exception message for retry logic
+            raise httpx.HTTPStatusError(
+                f"{response.status_code} - {error_text}",
+                request=response.request,
+                response=response,
             )
-            elapsed = time.time() - start_time
-
-            logger.debug("Response status: %d (%.2fs)", response.status_code, elapsed)
-
-            if response.status_code != 200:
-                error_text = response.text[:500]
-                logger.error("API error %d: %s", response.status_code, error_text)
-                # Include error details in exception message for retry logic
-                raise httpx.HTTPStatusError(
-                    f"{response.status_code} - {error_text}",
-                    request=response.request,
-                    response=response,
-                )
-            result = response.json()
-            logger.debug("Response keys: %s", list(result.keys()) if isinstance(result, dict) else type(result))
-            return result
+        result = response.json()
+        logger.debug("Response keys: %s", list(result.keys()) if isinstance(result, dict) else type(result))
+        return result
 
     async def get_county_fips(self, zip_code: str) -> dict[str, int] | None:
         """Get StateFips and CountyFips from ZIP code."""
@@ -503,7 +504,7 @@ class DataTreeAVMVendor:
             }]
         }
         """
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
 
         # Check for top-level errors
         if response.get("Message") and "unauthorized" in response.get("Message", "").lower():
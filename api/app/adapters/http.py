@@ -0,0 +1,42 @@
+"""
+Shared HTTP client for vendor adapters.
+
+Adapters that are called once per lead (PropertyReach, DataTree) go through a
+single pooled httpx.AsyncClient, so requests reuse keep-alive connections
+instead of paying a TCP/TLS handshake each time. Timeouts stay per request.
+"""
+
+import asyncio
+
+import httpx
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=64)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it for the running event loop if needed.
+
+    Pooled connections are bound to the loop that opened them, so a new loop
+    (e.g. a script calling asyncio.run() twice) gets a fresh client.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(limits=_LIMITS)
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (application shutdown).
+
+    A client left over from another, already-closed loop is just dropped.
+    """
+    global _client, _client_loop
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -13,12 +13,12 @@ Auth: x-api-key header
 Docs: https://docs.propertyreach.com/operations/Property%20Details
 """
 
+import asyncio
 import os
 from dataclasses import dataclass, field
 from typing import Any
 
-import httpx
-
+from app.adapters.http import get_http_client
 
 # =============================================================================
 # Configuration
@@ -47,7 +47,7 @@ def get_config() -> PropertyReachConfig | None:
 # Types (kept for downstream compatibility with ingest.py)
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class PropertyReachAddress:
     """Address for PropertyReach API."""
     street: str
@@ -195,24 +195,51 @@ class PropertyReachAdapter:
             print(f"PropertyReach property report failed: {e}")
             return None
 
+    async def get_property_reports(
+        self, addresses: list[PropertyReachAddress], max_concurrency: int = 10
+    ) -> list[PropertyReachFullReport | None]:
+        """Get property reports for many addresses, in input order.
+
+        PropertyReach has no bulk endpoint, so requests run concurrently over the
+        shared pooled client (keep-alive) instead of a new connection per address.
+        """
+        if not self.config:
+            print("PropertyReach not configured, returning None")
+            return [None] * len(addresses)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_one(address: PropertyReachAddress) -> PropertyReachFullReport | None:
+            async with semaphore:
+                try:
+                    data = await self._fetch_property(address)
+                    if not data:
+                        return None
+                    return self._parse_report(data)
+                except Exception as e:
+                    print(f"PropertyReach property report failed: {e}")
+                    return None
+
+        return list(await asyncio.gather(*(fetch_one(a) for a in addresses)))
+
     async def _fetch_property(self, address: PropertyReachAddress) -> dict[str, Any] | None:
         """Call GET /property with address query params."""
         if not self.config:
             raise RuntimeError("PropertyReach API not configured")
 
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.get(
-                f"{self.config.base_url}/property",
-                params={
-                    "streetAddress": address.street,
-                    "city": address.city,
-                    "state": address.state,
-                    "zipCode": address.zip,
-                },
-                headers={"x-api-key": self.config.api_key},
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client().get(
+            f"{self.config.base_url}/property",
+            params={
+                "streetAddress": address.street,
+                "city": address.city,
+                "state": address.state,
+                "zipCode": address.zip,
+            },
+            headers={"x-api-key": self.config.api_key},
+            timeout=self.config.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         meta = data.get("meta", {})
         if meta.get("hits", 0) == 0:
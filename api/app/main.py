@@ -1,26 +1,43 @@
 """DSCR Loan Automation Platform - FastAPI Backend"""
 
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
 
 from dotenv import load_dotenv
+
 load_dotenv()
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.routers import analytics, applications, ingest, leads, offers, property, valuation, validation
-from app.db.connection import init_db, close_db
 from app.auth import init_firebase
+from app.db.connection import close_db, init_db
+from app.routers import (
+    analytics,
+    applications,
+    ingest,
+    leads,
+    offers,
+    property,
+    validation,
+    valuation,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler for startup/shutdown."""
+    from app.adapters.http import close_http_client
+    from app.services.ingest import ingest_service, start_log_listener, stop_log_listener
+
     init_firebase()
+    start_log_listener()
     await init_db()
     yield
+    await close_http_client()
     await close_db()
+    ingest_service.cleanup_spilled_jobs()
+    stop_log_listener()
 
 
 app = FastAPI(
@@ -7,8 +7,7 @@ Endpoints for ingesting leads from Excel/CSV files.
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from pydantic import BaseModel, EmailStr
 
-from app.services.ingest import ingest_service, IngestStatus, LeadProcessingStatus
-
+from app.services.ingest import IngestStatus, LeadProcessingStatus, ingest_service
 
 router = APIRouter()
 
@@ -258,7 +257,7 @@ async def get_job(job_id: str) -> IngestJobDetailResponse:
 @router.get("/jobs", response_model=list[IngestJobResponse])
 async def list_jobs() -> list[IngestJobResponse]:
     """List all ingest jobs."""
-    jobs = list(ingest_service._jobs.values())
+    jobs = ingest_service.list_jobs()
     return [
         IngestJobResponse(
             id=job.id,
@@ -11,8 +11,8 @@ from enum import Enum
 from typing import Any
 from uuid import uuid4
 
-from app.services.rules import rules_engine, LoanData, RuleStatus
-from app.services.pricing import pricing_engine, PricingInput, PricingResult
+from app.services.pricing import PricingInput, PricingResult, RiskTier, pricing_engine
+from app.services.rules import LoanData, RuleStatus, rules_engine
 
 
 class DecisionType(str, Enum):
@@ -34,7 +34,7 @@ class DecisionReason(str, Enum):
     MANUAL_REVIEW_REQUIRED = "MANUAL_REVIEW_REQUIRED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition:
     """Condition for approval."""
     id: str
@@ -100,12 +100,13 @@ class DecisionService:
             pricing_result,
         )
 
-        # 4. Generate conditions
-        conditions = self._generate_conditions(
-            rules_result,
-            pricing_result,
-            loan_data,
-        )
+        # 4. Generate conditions (not needed once the loan is declined)
+        if decision_type is not DecisionType.DECLINED:
+            conditions = self._generate_conditions(
+                rules_result,
+                pricing_result,
+                loan_data,
+            )
 
         # 5. Add notes
         if rules_result.hard_stops:
@@ -159,7 +160,7 @@ class DecisionService:
             return DecisionType.REFERRED, DecisionReason.EXCEPTION_REQUIRED
 
         # High risk tier = referred
-        if pricing and pricing.risk_tier.value == "HIGH_RISK":
+        if pricing and pricing.risk_tier is RiskTier.HIGH_RISK:
             return DecisionType.REFERRED, DecisionReason.HIGH_RISK
 
         # Everything passes = conditionally approved
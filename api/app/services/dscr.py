@@ -6,12 +6,16 @@ and debt service (PITIA - Principal, Interest, Taxes, Insurance, Association due
 """
 
 import math
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final
 from uuid import uuid4
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # =============================================================================
 # Types
@@ -24,14 +28,18 @@ class WarningSeverity(str, Enum):
     ERROR = "ERROR"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Money:
     """Money value in cents."""
     amount: int  # cents
     currency: str = "USD"
 
 
-@dataclass
+# Shared zero value; Money is frozen so one instance can back every default
+ZERO_MONEY: Final = Money(0, "USD")
+
+
+@dataclass(slots=True)
 class RentRollEntry:
     """Rent roll entry for a unit."""
     unit_number: str | None = None
@@ -39,7 +47,7 @@ class RentRollEntry:
     bedrooms: int = 0
     bathrooms: float = 0
     square_feet: int | None = None
-    monthly_rent: Money = field(default_factory=lambda: Money(0))
+    monthly_rent: Money = ZERO_MONEY
     is_vacant: bool = False
     lease_expiration: datetime | None = None
 
@@ -73,7 +81,7 @@ class DSCRCalculationInput:
     other_monthly_expenses: Money | None = None
 
     # Loan terms
-    loan_amount: Money = field(default_factory=lambda: Money(0))
+    loan_amount: Money = ZERO_MONEY
     interest_rate: float = 0.0  # Annual rate as decimal (0.075 = 7.5%)
     term_months: int = 360
     interest_only_months: int | None = None
@@ -83,7 +91,7 @@ class DSCRCalculationInput:
     str_annualized_income: Money | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DSCRIncomeBreakdown:
     """Income breakdown."""
     gross_monthly_rent: Money
@@ -92,7 +100,7 @@ class DSCRIncomeBreakdown:
     other_income: Money | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DSCRExpenseBreakdown:
     """Expense breakdown."""
     property_tax_monthly: Money
@@ -104,14 +112,14 @@ class DSCRExpenseBreakdown:
     total_expenses: Money
 
 
-@dataclass
+@dataclass(slots=True)
 class DSCRNOIBreakdown:
     """NOI breakdown."""
     monthly: Money
     annual: Money
 
 
-@dataclass
+@dataclass(slots=True)
 class DSCRDebtServiceBreakdown:
     """Debt service breakdown."""
     principal_and_interest: Money
@@ -131,6 +139,8 @@ class DSCRCalculationResult:
     debt_service: DSCRDebtServiceBreakdown
 
     dscr_ratio: float
+    # Floored fixed-point ratio (1_000_000 = 1.00x); None if no debt service
+    dscr_ratio_micro: int | None
 
     calculated_at: datetime
     calculator_version: str
@@ -155,6 +165,29 @@ class DSCRScenario:
 # Calculator
 # =============================================================================
 
+@lru_cache(maxsize=16384)
+def _pow_factor(monthly_rate: float, num_payments: int) -> float:
+    """Compound factor (1 + r)^n, cached for rate sweeps (stress tests, what-ifs).
+
+    Keyed on the exact rate so cached results are bit-identical to math.pow.
+    """
+    return math.pow(1 + monthly_rate, num_payments)
+
+
+# DSCR formula explanation stored with every result
+_FORMULA_STR = """
+DSCR = NOI / Debt Service
+
+Where:
+  NOI = Effective Gross Income - Operating Expenses
+  Effective Gross Income = Gross Rent × (1 - Vacancy Rate) + Other Income
+  Operating Expenses = Management Fee + Property Tax + Insurance + HOA
+  Debt Service = P&I + Property Tax + Insurance + HOA (PITIA)
+
+Note: For DSCR loans, we use NOI / PITIA (not just P&I)
+""".strip()
+
+
 class DSCRCalculator:
     """DSCR calculator for investment properties."""
 
@@ -164,6 +197,12 @@ class DSCRCalculator:
     MINIMUM_DSCR = 1.0
     PREFERRED_DSCR = 1.25
 
+    # Thresholds are compared in integer micro-units (1_000_000 = 1.00x)
+    RATIO_SCALE = 1_000_000
+    MINIMUM_DSCR_MICRO = int(MINIMUM_DSCR * RATIO_SCALE)
+    PREFERRED_DSCR_MICRO = int(PREFERRED_DSCR * RATIO_SCALE)
+    HIGH_DSCR_MICRO = 3 * RATIO_SCALE
+
     def calculate(self, input_data: DSCRCalculationInput) -> DSCRCalculationResult:
         """Calculate DSCR for an application."""
         warnings: list[DSCRWarning] = []
@@ -176,7 +215,7 @@ class DSCRCalculator:
         effective_gross_rent = self._apply_vacancy(gross_monthly_rent, vacancy_rate)
 
         # 3. Add other income
-        other_income = input_data.other_income or Money(0)
+        other_income = input_data.other_income or ZERO_MONEY
         total_gross_income = self._add_money(effective_gross_rent, other_income)
 
         # 4. Calculate expenses
@@ -190,10 +229,19 @@ class DSCRCalculator:
         debt_service = self._calculate_debt_service(input_data)
 
         # 7. Calculate DSCR
-        dscr_ratio = self._calculate_ratio(noi_monthly, debt_service.total_pitia)
+        dscr_ratio_micro: int | None
+        if debt_service.total_pitia.amount:
+            dscr_ratio = self._calculate_ratio(noi_monthly, debt_service.total_pitia)
+            dscr_ratio_micro = self._calculate_ratio_micro(noi_monthly, debt_service.total_pitia)
+            meets_minimum = dscr_ratio_micro >= self.MINIMUM_DSCR_MICRO
+        else:
+            # No debt service: coverage is infinite regardless of NOI
+            dscr_ratio_micro = None
+            dscr_ratio = float("inf")
+            meets_minimum = True
 
         # Validate and add warnings
-        self._validate_result(dscr_ratio, warnings)
+        self._validate_result(dscr_ratio, dscr_ratio_micro, warnings)
 
         return DSCRCalculationResult(
             id=str(uuid4()),
@@ -209,12 +257,13 @@ class DSCRCalculator:
             noi=DSCRNOIBreakdown(monthly=noi_monthly, annual=noi_annual),
             debt_service=debt_service,
             dscr_ratio=dscr_ratio,
+            dscr_ratio_micro=dscr_ratio_micro,
             calculated_at=datetime.utcnow(),
             calculator_version=self.CALCULATOR_VERSION,
             inputs=self._sanitize_inputs(input_data),
-            formula=self._get_formula(),
+            formula=_FORMULA_STR,
             warnings=warnings,
-            meets_minimum=dscr_ratio >= self.MINIMUM_DSCR,
+            meets_minimum=meets_minimum,
             minimum_required=self.MINIMUM_DSCR,
         )
 
@@ -308,7 +357,7 @@ class DSCRCalculator:
         target = target_dscr or self.MINIMUM_DSCR
 
         # Calculate NOI
-        gross_monthly_rent = input_data.gross_monthly_rent or Money(0)
+        gross_monthly_rent = input_data.gross_monthly_rent or ZERO_MONEY
         vacancy_rate = input_data.vacancy_rate or self.DEFAULT_VACANCY_RATE
         effective_gross_rent = self._apply_vacancy(gross_monthly_rent, vacancy_rate)
 
@@ -326,20 +375,67 @@ class DSCRCalculator:
         max_pi = self._subtract_money(max_pitia, ti_monthly)
 
         if max_pi.amount <= 0:
-            return Money(0)
+            return ZERO_MONEY
 
         # Back-calculate loan amount from P&I
         monthly_rate = input_data.interest_rate / 12
         num_payments = input_data.term_months
 
         if monthly_rate > 0:
-            factor = math.pow(1 + monthly_rate, num_payments)
+            factor = _pow_factor(monthly_rate, num_payments)
             loan_amount_cents = (max_pi.amount * (factor - 1)) / (monthly_rate * factor)
         else:
             loan_amount_cents = max_pi.amount * num_payments
 
         return Money(int(loan_amount_cents))
 
+    def calculate_many(self, cols: dict[str, "np.ndarray"]) -> "np.ndarray":
+        """Calculate DSCR ratios for many independent loans at once.
+
+        Columnar batch path for portfolio revaluation (e.g. rate-shock runs).
+        Expects equal-length arrays: loan_amount_cents, interest_rate (annual
+        decimal), term_months, gross_monthly_rent_cents, vacancy_rate,
+        annual_tax_cents, annual_ins_cents, monthly_hoa_cents, mgmt_rate.
+        Zero vacancy/management rates fall back to the defaults, as in
+        calculate(). Covers fully amortizing loans without rent rolls, other
+        income or STR income; returns the dscr_ratio array.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is required for batch DSCR. Run: pip install numpy")
+
+        loan = np.asarray(cols["loan_amount_cents"], dtype=np.float64)
+        annual_rate = np.asarray(cols["interest_rate"], dtype=np.float64)
+        term = np.asarray(cols["term_months"], dtype=np.float64)
+        rent = np.asarray(cols["gross_monthly_rent_cents"], dtype=np.float64)
+        vacancy = np.asarray(cols["vacancy_rate"], dtype=np.float64)
+        annual_tax = np.asarray(cols["annual_tax_cents"], dtype=np.float64)
+        annual_ins = np.asarray(cols["annual_ins_cents"], dtype=np.float64)
+        hoa = np.asarray(cols["monthly_hoa_cents"], dtype=np.int64)
+        mgmt_rate = np.asarray(cols["mgmt_rate"], dtype=np.float64)
+
+        vacancy = np.where(vacancy == 0, self.DEFAULT_VACANCY_RATE, vacancy)
+        mgmt_rate = np.where(mgmt_rate == 0, self.DEFAULT_MANAGEMENT_FEE_RATE, mgmt_rate)
+
+        # Income and expenses in cents, truncated like the scalar Money helpers
+        effective_rent = np.trunc(rent * (1 - vacancy)).astype(np.int64)
+        tax_monthly = np.trunc(annual_tax / 12).astype(np.int64)
+        ins_monthly = np.trunc(annual_ins / 12).astype(np.int64)
+        mgmt_monthly = np.trunc(effective_rent * mgmt_rate).astype(np.int64)
+        noi = effective_rent - (tax_monthly + ins_monthly + hoa + mgmt_monthly)
+
+        # P&I = L * r * f / (f - 1) with f = (1 + r)^n; L / n when r == 0
+        loan_dollars = loan / 100
+        monthly_rate = annual_rate / 12
+        factor = np.power(1 + monthly_rate, term)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            amortizing = (loan_dollars * monthly_rate * factor) / (factor - 1)
+        monthly_pi = np.where(monthly_rate > 0, amortizing, loan_dollars / term)
+        pitia = np.trunc(monthly_pi * 100).astype(np.int64) + tax_monthly + ins_monthly + hoa
+
+        return np.where(pitia == 0, np.inf, noi / np.maximum(pitia, 1))
+
     # =========================================================================
     # Private Methods
     # =========================================================================
@@ -356,7 +452,7 @@ class DSCRCalculator:
 
         # If rent roll provided, sum it up
         if input_data.rent_roll:
-            total = Money(0)
+            total = ZERO_MONEY
             for entry in input_data.rent_roll:
                 if not entry.is_vacant:
                     total = self._add_money(total, entry.monthly_rent)
@@ -384,7 +480,7 @@ class DSCRCalculator:
             message="No rental income data provided",
             severity=WarningSeverity.ERROR,
         ))
-        return Money(0)
+        return ZERO_MONEY
 
     def _apply_vacancy(self, gross_rent: Money, vacancy_rate: float) -> Money:
         """Apply vacancy rate to gross rent."""
@@ -401,28 +497,28 @@ class DSCRCalculator:
         property_tax_monthly = (
             self._divide_money(input_data.annual_property_tax, 12)
             if input_data.annual_property_tax
-            else Money(0)
+            else ZERO_MONEY
         )
 
         # Insurance (annual to monthly)
         insurance_monthly = (
             self._divide_money(input_data.annual_insurance, 12)
             if input_data.annual_insurance
-            else Money(0)
+            else ZERO_MONEY
         )
 
         # HOA
-        hoa_monthly = input_data.monthly_hoa or Money(0)
+        hoa_monthly = input_data.monthly_hoa or ZERO_MONEY
 
         # Management fee
         mgmt_rate = input_data.management_fee_rate or self.DEFAULT_MANAGEMENT_FEE_RATE
         management_fee_monthly = self._multiply_money(total_gross_income, mgmt_rate)
 
         # Flood insurance
-        flood_insurance_monthly = input_data.monthly_flood_insurance or Money(0)
+        flood_insurance_monthly = input_data.monthly_flood_insurance or ZERO_MONEY
 
         # Other expenses
-        other_expenses = input_data.other_monthly_expenses or Money(0)
+        other_expenses = input_data.other_monthly_expenses or ZERO_MONEY
 
         # Validate expense ratio
         expense_sum = (
@@ -440,13 +536,11 @@ class DSCRCalculator:
                     severity=WarningSeverity.WARNING,
                 ))
 
-        # Total expenses
-        total = property_tax_monthly
-        total = self._add_money(total, insurance_monthly)
-        total = self._add_money(total, hoa_monthly)
-        total = self._add_money(total, management_fee_monthly)
-        total = self._add_money(total, flood_insurance_monthly)
-        total = self._add_money(total, other_expenses)
+        # Total expenses (summed on raw cents, one Money allocation)
+        total = Money(
+            expense_sum + flood_insurance_monthly.amount + other_expenses.amount,
+            property_tax_monthly.currency,
+        )
 
         return DSCRExpenseBreakdown(
             property_tax_monthly=property_tax_monthly,
@@ -463,21 +557,23 @@ class DSCRCalculator:
         property_tax_monthly = (
             self._divide_money(input_data.annual_property_tax, 12)
             if input_data.annual_property_tax
-            else Money(0)
+            else ZERO_MONEY
         )
         insurance_monthly = (
             self._divide_money(input_data.annual_insurance, 12)
             if input_data.annual_insurance
-            else Money(0)
+            else ZERO_MONEY
         )
-        hoa_monthly = input_data.monthly_hoa or Money(0)
-        flood_insurance_monthly = input_data.monthly_flood_insurance or Money(0)
+        hoa_monthly = input_data.monthly_hoa or ZERO_MONEY
+        flood_insurance_monthly = input_data.monthly_flood_insurance or ZERO_MONEY
 
-        total = property_tax_monthly
-        total = self._add_money(total, insurance_monthly)
-        total = self._add_money(total, hoa_monthly)
-        total = self._add_money(total, flood_insurance_monthly)
-        return total
+        return Money(
+            property_tax_monthly.amount
+            + insurance_monthly.amount
+            + hoa_monthly.amount
+            + flood_insurance_monthly.amount,
+            property_tax_monthly.currency,
+        )
 
     def _calculate_debt_service(
         self, input_data: DSCRCalculationInput
@@ -493,7 +589,7 @@ class DSCRCalculator:
         else:
             # Fully amortizing
             if monthly_rate > 0:
-                factor = math.pow(1 + monthly_rate, num_payments)
+                factor = _pow_factor(monthly_rate, num_payments)
                 monthly_pi = (loan_dollars * monthly_rate * factor) / (factor - 1)
             else:
                 monthly_pi = loan_dollars / num_payments
@@ -504,19 +600,22 @@ class DSCRCalculator:
         property_tax_monthly = (
             self._divide_money(input_data.annual_property_tax, 12)
             if input_data.annual_property_tax
-            else Money(0)
+            else ZERO_MONEY
         )
         insurance_monthly = (
             self._divide_money(input_data.annual_insurance, 12)
             if input_data.annual_insurance
-            else Money(0)
+            else ZERO_MONEY
         )
-        hoa_monthly = input_data.monthly_hoa or Money(0)
+        hoa_monthly = input_data.monthly_hoa or ZERO_MONEY
 
-        total_pitia = principal_and_interest
-        total_pitia = self._add_money(total_pitia, property_tax_monthly)
-        total_pitia = self._add_money(total_pitia, insurance_monthly)
-        total_pitia = self._add_money(total_pitia, hoa_monthly)
+        total_pitia = Money(
+            principal_and_interest.amount
+            + property_tax_monthly.amount
+            + insurance_monthly.amount
+            + hoa_monthly.amount,
+            principal_and_interest.currency,
+        )
 
         return DSCRDebtServiceBreakdown(
             principal_and_interest=principal_and_interest,
@@ -529,24 +628,36 @@ class DSCRCalculator:
             return float("inf")
         return noi.amount / debt_service.amount
 
+    def _calculate_ratio_micro(self, noi: Money, debt_service: Money) -> int:
+        """Calculate DSCR ratio in micro-units, floored (debt service must be non-zero)."""
+        return (noi.amount * self.RATIO_SCALE) // debt_service.amount
+
     def _validate_result(
-        self, dscr_ratio: float, warnings: list[DSCRWarning]
+        self, dscr_ratio: float, dscr_ratio_micro: int | None, warnings: list[DSCRWarning]
     ) -> None:
-        """Validate DSCR result and add warnings."""
-        if dscr_ratio < self.MINIMUM_DSCR:
+        """Validate DSCR result and add warnings (None = zero debt service, infinite DSCR)."""
+        if dscr_ratio_micro is None:
+            warnings.append(DSCRWarning(
+                code="UNUSUALLY_HIGH_DSCR",
+                message="DSCR of inf is unusually high - verify income data",
+                severity=WarningSeverity.INFO,
+            ))
+            return
+
+        if dscr_ratio_micro < self.MINIMUM_DSCR_MICRO:
             warnings.append(DSCRWarning(
                 code="BELOW_MINIMUM_DSCR",
                 message=f"DSCR of {dscr_ratio:.3f} is below minimum requirement of {self.MINIMUM_DSCR}",
                 severity=WarningSeverity.ERROR,
             ))
-        elif dscr_ratio < self.PREFERRED_DSCR:
+        elif dscr_ratio_micro < self.PREFERRED_DSCR_MICRO:
             warnings.append(DSCRWarning(
                 code="BELOW_PREFERRED_DSCR",
                 message=f"DSCR of {dscr_ratio:.3f} is below preferred level of {self.PREFERRED_DSCR}",
                 severity=WarningSeverity.WARNING,
             ))
 
-        if dscr_ratio > 3.0:
+        if dscr_ratio_micro > self.HIGH_DSCR_MICRO:
             warnings.append(DSCRWarning(
                 code="UNUSUALLY_HIGH_DSCR",
                 message=f"DSCR of {dscr_ratio:.3f} is unusually high - verify income data",
@@ -568,20 +679,6 @@ class DSCRCalculator:
             "is_short_term_rental": input_data.is_short_term_rental,
         }
 
-    def _get_formula(self) -> str:
-        """Get DSCR formula explanation."""
-        return """
-DSCR = NOI / Debt Service
-
-Where:
-  NOI = Effective Gross Income - Operating Expenses
-  Effective Gross Income = Gross Rent × (1 - Vacancy Rate) + Other Income
-  Operating Expenses = Management Fee + Property Tax + Insurance + HOA
-  Debt Service = P&I + Property Tax + Insurance + HOA (PITIA)
-
-Note: For DSCR loans, we use NOI / PITIA (not just P&I)
-        """.strip()
-
     # Money utility methods
     def _add_money(self, a: Money, b: Money) -> Money:
         return Money(a.amount + b.amount, a.currency)
@@ -10,30 +10,49 @@ Ingests leads from Excel/CSV/Google Sheets and runs the full pipeline:
 6. Generate loan offer
 """
 
+import asyncio
 import csv
 import io
+import itertools
+import pickle
 import re
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+import secrets
+import tempfile
+import warnings
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, BinaryIO
+from urllib.parse import unquote_plus
 from uuid import uuid4
-from urllib.parse import urlparse, parse_qs
 
-from app.adapters.propertyreach import property_reach, PropertyReachAddress
-from app.adapters.datatree import datatree_avm, datatree_property, Address as DataTreeAddress
-from app.adapters.rentcast import rentcast_service
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # Excel ingest falls back to openpyxl
+    CalamineWorkbook = None  # type: ignore[assignment,misc]
+
+import logging
+import logging.handlers
+import queue
+
+from app.adapters.base import AVMResult, DataSources, RentEstimateResult, VerificationResult
+from app.adapters.clear_capital import PropertyAnalyticsResult, clear_capital_service
+from app.adapters.datatree import Address as DataTreeAddress
+from app.adapters.datatree import datatree_avm, datatree_property
 from app.adapters.encompass import encompass_client
-from app.adapters.base import AVMResult, RentEstimateResult, VerificationResult, DataSources
-from app.adapters.clear_capital import clear_capital_service, PropertyAnalyticsResult
-from app.adapters.zillow_scraper import zillow_scraper
+from app.adapters.propertyreach import PropertyReachAddress, property_reach
 from app.adapters.redfin_scraper import redfin_scraper
-from app.services.dscr import dscr_calculator, DSCRCalculationInput, Money
-from app.services.decision import decision_service, DecisionType
+from app.adapters.rentcast import rentcast_service
+from app.adapters.zillow_scraper import zillow_scraper
+from app.services.decision import DecisionType, decision_service
+from app.services.dscr import DSCRCalculationInput, Money, dscr_calculator
 from app.services.rules import LoanData
-from app.services.pricing import PricingInput
+from app.utils import TTLCache
 
-import logging
 logger = logging.getLogger("pipeline")
 logger.setLevel(logging.DEBUG)
 # Ensure logs are visible in console
@@ -43,6 +62,64 @@ if not logger.handlers:
     handler.setFormatter(logging.Formatter('%(message)s'))
     logger.addHandler(handler)
 
+# While the app runs (see main.lifespan), records go through a queue so the console
+# write happens on a listener thread, not on the event loop.
+_log_listener: logging.handlers.QueueListener | None = None
+_log_queue_handler: logging.handlers.QueueHandler | None = None
+
+
+def start_log_listener() -> None:
+    """Move the pipeline logger's handlers behind a queue drained by a listener thread."""
+    global _log_listener, _log_queue_handler
+    if _log_listener is not None:
+        return
+    handlers = list(logger.handlers)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _log_queue_handler = logging.handlers.QueueHandler(log_queue)
+    _log_listener.start()
+    logger.addHandler(_log_queue_handler)
+    for handler in handlers:
+        logger.removeHandler(handler)
+
+
+def stop_log_listener() -> None:
+    """Flush queued records, stop the listener thread and restore the direct handlers."""
+    global _log_listener, _log_queue_handler
+    if _log_listener is None:
+        return
+    listener, queue_handler = _log_listener, _log_queue_handler
+    _log_listener = _log_queue_handler = None
+    for handler in listener.handlers:
+        logger.addHandler(handler)
+    logger.removeHandler(queue_handler)
+    listener.stop()
+
+# pandas drops whitespace-only lines that csv.DictReader counts as rows, which would
+# shift row numbers; CSVs containing one are parsed with DictReader instead
+_BLANK_CSV_LINE_RE = re.compile(r"^[ \t]+\r?$", re.MULTILINE)
+
+# Loan-amount sanitizer: keep digits and the decimal point ("$450,000.00" -> "450000.00").
+# ASCII input takes the str.translate fast path; the regex also handles Unicode digits.
+_LOAN_CLEAN_RE = re.compile(r"[^\d.]")
+# Cleaned strings that float() accepts (rejects "", ".", "1.2.3")
+_LOAN_NUMBER_RE = re.compile(r"\d+\.?\d*|\.\d+")
+
+# Query keys read by IngestService._parse_propertyreach_url
+_URL_ADDRESS_KEYS = frozenset({"address", "street", "city", "state", "zip", "zipcode"})
+_LOAN_DELETE_TABLE = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not (chr(c).isdigit() or chr(c) == ".")
+))
+
+
+def _clean_loan_amount(value: str) -> str:
+    """Strip currency symbols, separators and other non-numeric characters."""
+    if value.isascii():
+        return value.translate(_LOAN_DELETE_TABLE)
+    return _LOAN_CLEAN_RE.sub("", value)
+
 
 class IngestStatus(str, Enum):
     """Status of ingest job."""
@@ -64,7 +141,7 @@ class LeadProcessingStatus(str, Enum):
     SKIPPED = "SKIPPED"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedLead:
     """Lead parsed from file."""
     row_number: int
@@ -81,7 +158,7 @@ class ParsedLead:
     raw_data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedLead:
     """Lead after processing through pipeline."""
     lead_id: str
@@ -121,11 +198,11 @@ class ProcessedLead:
     data_sources: DataSources | None = None
 
     # Timestamps
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     processed_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestJob:
     """Ingest job tracking."""
     id: str
@@ -137,12 +214,12 @@ class IngestJob:
     failed_leads: int = 0
     skipped_leads: int = 0
     leads: list[ProcessedLead] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     completed_at: datetime | None = None
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestConfig:
     """Configuration for ingest pipeline. Reads from env vars at init for runtime flexibility."""
     min_dscr: float = 1.0  # Minimum DSCR to qualify for offer
@@ -152,7 +229,20 @@ class IngestConfig:
     default_loan_term_months: int = 360
     default_vacancy_rate: float = 0.05
     default_credit_score: int = 720  # FICO score assumption
+    # DSCR fallbacks when property data lacks a value (cents)
+    default_rent_cents: int = 350_000  # $3,500/mo
+    default_annual_taxes_cents: int = 720_000  # $7,200/yr
+    default_property_value_cents: int = 60_000_000  # $600K
+    insurance_rate: float = 0.0035  # Annual insurance as a fraction of value (0.35%)
     create_offers: bool = True  # Create offers for qualifying leads
+    max_concurrency: int = 16  # Leads processed in parallel (bounded by upstream API limits)
+    csv_chunksize: int = 10_000  # Rows per pandas chunk when parsing CSV
+    prefetch_batch_size: int = 50  # Addresses per PropertyReach prefetch shard
+    retain_raw_data: bool = False  # Keep the full source row on each lead (diagnostics)
+    max_jobs_in_memory: int = 128  # Finished jobs beyond this are spilled to disk
+    job_spill_dir: str | None = None  # Defaults to a temp directory removed on shutdown
+    lookup_cache_ttl_seconds: int = 3600  # How long property/AVM lookups are reused
+    lookup_cache_max_entries: int = 4096  # Per cache, least recently used evicted first
 
     # Clear Capital premium verification thresholds
     # Only call Clear Capital when ALL conditions are met:
@@ -180,6 +270,14 @@ class IngestConfig:
             self.premium_ltv_threshold = float(v)
         if v := os.getenv("REQUIRE_SCRAPE_VERIFICATION"):
             self.require_scrape_verification = v.lower() in ("true", "1", "yes")
+        if v := os.getenv("INGEST_MAX_CONCURRENCY"):
+            self.max_concurrency = max(1, int(v))
+        if v := os.getenv("INGEST_RETAIN_RAW_DATA"):
+            self.retain_raw_data = v.lower() in ("true", "1", "yes")
+        if v := os.getenv("INGEST_MAX_JOBS_IN_MEMORY"):
+            self.max_jobs_in_memory = max(0, int(v))
+        if v := os.getenv("INGEST_JOB_SPILL_DIR"):
+            self.job_spill_dir = v
 
 
 class IngestService:
@@ -199,9 +297,42 @@ class IngestService:
         "loan_amount": ["loan_amount", "amount", "loan_amt", "requested_amount"],
     }
 
+    # Source columns read from ParsedLead.raw_data downstream; always retained
+    RAW_DATA_KEYS = ("encompass_guid",)
+
+    # Reverse index: alias -> (field, priority of the alias within that field)
+    _ALIAS_TO_FIELD: dict[str, tuple[str, int]] = {
+        alias: (field, rank)
+        for field, aliases in COLUMN_MAPPINGS.items()
+        for rank, alias in enumerate(aliases)
+    }
+
     def __init__(self, config: IngestConfig | None = None) -> None:
         self.config = config or IngestConfig()
-        self._jobs: dict[str, IngestJob] = {}
+        # Money is immutable, so the DSCR fallbacks are built once and shared
+        self._default_rent = Money(self.config.default_rent_cents)
+        self._default_annual_taxes = Money(self.config.default_annual_taxes_cents)
+        self._default_annual_insurance = Money(
+            int(self.config.default_property_value_cents * self.config.insurance_rate)
+        )
+        # Jobs in memory, least recently used first. Finished jobs beyond
+        # config.max_jobs_in_memory are pickled to disk; _spilled_jobs keeps a
+        # lead-less summary of each for list_jobs().
+        self._jobs: OrderedDict[str, IngestJob] = OrderedDict()
+        self._spilled_jobs: dict[str, IngestJob] = {}
+        self._spill_dir: Path | None = None
+        self._spill_tmpdir: tempfile.TemporaryDirectory[str] | None = None
+        # Per-address lookups, keyed by _address_key(): resolved results,
+        # TTL- and LRU-bounded, plus the requests still in flight so
+        # concurrent leads for the same address share one request.
+        self._property_cache: TTLCache[tuple[str, str, str, str], Any] = TTLCache(
+            self.config.lookup_cache_ttl_seconds, self.config.lookup_cache_max_entries
+        )
+        self._avm_cache: TTLCache[tuple[str, str, str, str], Any] = TTLCache(
+            self.config.lookup_cache_ttl_seconds, self.config.lookup_cache_max_entries
+        )
+        self._property_inflight: dict[tuple[str, str, str, str], asyncio.Future[Any]] = {}
+        self._avm_inflight: dict[tuple[str, str, str, str], asyncio.Future[Any]] = {}
 
     async def ingest_csv(
         self,
@@ -214,7 +345,7 @@ class IngestService:
             filename=filename,
             status=IngestStatus.PROCESSING,
         )
-        self._jobs[job.id] = job
+        self._register_job(job)
 
         try:
             # Parse CSV
@@ -224,26 +355,16 @@ class IngestService:
             leads = self._parse_csv(file_content)
             job.total_leads = len(leads)
 
-            # Process each lead
-            for parsed_lead in leads:
-                processed = await self._process_lead(parsed_lead)
-                job.leads.append(processed)
-                job.processed_leads += 1
-
-                if processed.status == LeadProcessingStatus.OFFER_CREATED:
-                    job.successful_leads += 1
-                elif processed.status == LeadProcessingStatus.FAILED:
-                    job.failed_leads += 1
-                elif processed.status == LeadProcessingStatus.SKIPPED:
-                    job.skipped_leads += 1
+            # Process leads concurrently (bounded by config.max_concurrency)
+            await self._process_leads(job, leads)
 
             job.status = IngestStatus.COMPLETED if job.failed_leads == 0 else IngestStatus.PARTIAL
-            job.completed_at = datetime.now(timezone.utc)
+            job.completed_at = datetime.now(UTC)
 
         except Exception as e:
             job.status = IngestStatus.FAILED
             job.error_message = str(e)
-            job.completed_at = datetime.now(timezone.utc)
+            job.completed_at = datetime.now(UTC)
 
         return job
 
@@ -252,56 +373,303 @@ class IngestService:
         file: BinaryIO,
         filename: str = "upload.xlsx",
     ) -> IngestJob:
-        """Ingest leads from Excel file."""
-        try:
-            import openpyxl
-        except ImportError:
-            raise ImportError("openpyxl is required for Excel files. Run: pip install openpyxl")
+        """Ingest leads from Excel file.
+
+        Uses python-calamine (Rust XLSX reader) when installed, else openpyxl.
+        """
+        if CalamineWorkbook is None:
+            try:
+                import openpyxl
+            except ImportError:
+                raise ImportError("openpyxl is required for Excel files. Run: pip install openpyxl")
 
         job = IngestJob(
             id=str(uuid4()),
             filename=filename,
             status=IngestStatus.PROCESSING,
         )
-        self._jobs[job.id] = job
+        self._register_job(job)
 
         try:
             # Parse Excel
-            workbook = openpyxl.load_workbook(file, read_only=True)
-            sheet = workbook.active
+            # Rows are streamed from the sheet; only the parsed leads are kept
+            if CalamineWorkbook is not None:
+                sheet = CalamineWorkbook.from_filelike(file).get_sheet_by_index(0)
+                # Skip leading blank rows, as sheet.to_python() does
+                rows = itertools.dropwhile(
+                    lambda row: all(cell == "" for cell in row), sheet.iter_rows()
+                )
+                leads = list(self._parse_excel_sheet(
+                    [self._normalize_calamine_cell(cell) for cell in row] for row in rows
+                ))
+            else:
+                workbook = openpyxl.load_workbook(file, read_only=True)
+                try:
+                    leads = list(self._parse_excel_sheet(
+                        workbook.active.iter_rows(values_only=True)
+                    ))
+                finally:
+                    workbook.close()
 
-            leads = self._parse_excel_sheet(sheet)
             job.total_leads = len(leads)
 
-            # Process each lead
-            for parsed_lead in leads:
-                processed = await self._process_lead(parsed_lead)
-                job.leads.append(processed)
-                job.processed_leads += 1
-
-                if processed.status == LeadProcessingStatus.OFFER_CREATED:
-                    job.successful_leads += 1
-                elif processed.status == LeadProcessingStatus.FAILED:
-                    job.failed_leads += 1
-                elif processed.status == LeadProcessingStatus.SKIPPED:
-                    job.skipped_leads += 1
+            # Process leads concurrently (bounded by config.max_concurrency)
+            await self._process_leads(job, leads)
 
             job.status = IngestStatus.COMPLETED if job.failed_leads == 0 else IngestStatus.PARTIAL
-            job.completed_at = datetime.now(timezone.utc)
+            job.completed_at = datetime.now(UTC)
 
         except Exception as e:
             job.status = IngestStatus.FAILED
             job.error_message = str(e)
-            job.completed_at = datetime.now(timezone.utc)
+            job.completed_at = datetime.now(UTC)
 
         return job
 
+    async def _process_leads(self, job: IngestJob, leads: list[ParsedLead]) -> None:
+        """Run leads through the pipeline concurrently and record results on the job.
+
+        Each lead is I/O-bound (property/AVM/rent APIs), so leads are fanned out
+        with asyncio.gather behind a semaphore. Results keep file order.
+        Property data for all unique addresses is prefetched in batches first.
+        """
+        await self._prefetch_property_data(leads)
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def run(parsed_lead: ParsedLead) -> ProcessedLead:
+            async with semaphore:
+                return await self._process_lead(parsed_lead)
+
+        results = await asyncio.gather(
+            *(run(parsed_lead) for parsed_lead in leads),
+            return_exceptions=True,
+        )
+
+        for parsed_lead, result in zip(leads, results):
+            if isinstance(result, BaseException):
+                processed = ProcessedLead(
+                    lead_id=str(uuid4()),
+                    parsed_lead=parsed_lead,
+                    status=LeadProcessingStatus.FAILED,
+                    error_message=str(result),
+                    processed_at=datetime.now(UTC),
+                )
+            else:
+                processed = result
+
+            job.leads.append(processed)
+            job.processed_leads += 1
+
+            if processed.status == LeadProcessingStatus.OFFER_CREATED:
+                job.successful_leads += 1
+            elif processed.status == LeadProcessingStatus.FAILED:
+                job.failed_leads += 1
+            elif processed.status == LeadProcessingStatus.SKIPPED:
+                job.skipped_leads += 1
+
     def get_job(self, job_id: str) -> IngestJob | None:
-        """Get ingest job by ID."""
-        return self._jobs.get(job_id)
+        """Get ingest job by ID, reloading it from disk if it was spilled."""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            self._jobs.move_to_end(job_id)
+            return job
+
+        summary = self._spilled_jobs.get(job_id)
+        if summary is None:
+            return None
+
+        path = self._job_spill_path(job_id)
+        try:
+            with path.open("rb") as f:
+                job = pickle.load(f)
+        except Exception:
+            logger.warning("Could not reload spilled ingest job %s", job_id, exc_info=True)
+            return summary
+
+        del self._spilled_jobs[job_id]
+        path.unlink(missing_ok=True)
+        self._register_job(job)
+        return job
+
+    def list_jobs(self) -> list[IngestJob]:
+        """All known jobs, oldest first. Spilled jobs are returned without leads."""
+        jobs = [*self._jobs.values(), *self._spilled_jobs.values()]
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    def _register_job(self, job: IngestJob) -> None:
+        """Track a job, spilling least recently used finished jobs over the limit."""
+        self._jobs[job.id] = job
+
+        excess = len(self._jobs) - self.config.max_jobs_in_memory
+        if excess <= 0:
+            return
+
+        finished = [
+            job_id for job_id, j in self._jobs.items()
+            if j.status not in (IngestStatus.PENDING, IngestStatus.PROCESSING)
+        ]
+        for job_id in finished[:excess]:
+            if self._spill_job(self._jobs[job_id]):
+                del self._jobs[job_id]
+
+    def _spill_job(self, job: IngestJob) -> bool:
+        """Pickle a finished job to disk. Returns False if it must stay in memory."""
+        path = self._job_spill_path(job.id)
+        try:
+            with path.open("wb") as f:
+                pickle.dump(job, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            logger.warning("Could not spill ingest job %s to disk", job.id, exc_info=True)
+            path.unlink(missing_ok=True)
+            return False
+
+        self._spilled_jobs[job.id] = replace(job, leads=[])
+        return True
+
+    def _job_spill_path(self, job_id: str) -> Path:
+        if self._spill_dir is None:
+            if self.config.job_spill_dir:
+                self._spill_dir = Path(self.config.job_spill_dir)
+                self._spill_dir.mkdir(parents=True, exist_ok=True)
+            else:
+                self._spill_tmpdir = tempfile.TemporaryDirectory(prefix="ingest-jobs-")
+                self._spill_dir = Path(self._spill_tmpdir.name)
+        return self._spill_dir / f"ingest-{job_id}.pkl"
+
+    def cleanup_spilled_jobs(self) -> None:
+        """Delete spilled job files, and the spill directory if this service created it."""
+        if self._spill_dir is None:
+            return
+        if self._spill_tmpdir is not None:
+            self._spill_tmpdir.cleanup()
+            self._spill_tmpdir = None
+        else:
+            for job_id in self._spilled_jobs:
+                self._job_spill_path(job_id).unlink(missing_ok=True)
+        self._spilled_jobs.clear()
+        self._spill_dir = None
 
     def _parse_csv(self, content: str) -> list[ParsedLead]:
-        """Parse CSV content into leads."""
+        """Parse CSV content into leads.
+
+        Uses chunked pandas parsing when pandas is installed (``batch`` extra),
+        otherwise falls back to csv.DictReader. Files pandas would read
+        differently from DictReader (blank or duplicate header names, rows with
+        extra fields, whitespace-only lines) also go through DictReader, as does
+        retain_raw_data mode, which keeps extra fields in raw_data.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            return self._parse_csv_rows(content)
+
+        header = next(csv.reader(io.StringIO(content)), None)
+        if (
+            not header
+            or len(set(header)) != len(header)
+            or self.config.retain_raw_data
+            or _BLANK_CSV_LINE_RE.search(content)
+        ):
+            return self._parse_csv_rows(content)
+
+        column_map = self._map_columns(header)
+        leads: list[ParsedLead] = []
+        try:
+            with warnings.catch_warnings():
+                # Rows with extra fields: pandas warns and drops data, or raises
+                warnings.simplefilter("error", pd.errors.ParserWarning)
+                chunks = pd.read_csv(
+                    io.StringIO(content),
+                    chunksize=self.config.csv_chunksize,
+                    dtype=str,
+                    keep_default_na=False,
+                    index_col=False,
+                )
+                with chunks:
+                    for df in chunks:
+                        if len(df.columns) != len(header):
+                            return self._parse_csv_rows(content)
+                        df.columns = header  # DictReader keys, not pandas' "Unnamed: n"
+                        leads.extend(self._chunk_to_leads(df, column_map))
+        except pd.errors.EmptyDataError:
+            return []
+        except (pd.errors.ParserError, pd.errors.ParserWarning):
+            return self._parse_csv_rows(content)
+
+        return leads
+
+    def _chunk_to_leads(self, df: Any, column_map: dict[str, str]) -> list[ParsedLead]:
+        """Convert one pandas CSV chunk into leads (same rules as _row_to_lead)."""
+        import pandas as pd
+
+        if not all(f in column_map for f in ("first_name", "last_name", "email")):
+            return []
+
+        df = df.fillna("")  # short rows
+
+        # Skip rows without required fields, before touching any other column
+        mask = (
+            df[column_map["first_name"]].str.strip().str.len().gt(0)
+            & df[column_map["last_name"]].str.strip().str.len().gt(0)
+            & df[column_map["email"]].str.strip().str.len().gt(0)
+        )
+        df = df[mask]
+
+        mapped = pd.DataFrame(index=df.index)
+        for field in self.COLUMN_MAPPINGS:
+            col = column_map.get(field)
+            if col is None:
+                mapped[field] = None
+            else:
+                raw = df[col]
+                # object dtype so blanks stay None (pandas 3 StringDtype would fill NaN)
+                mapped[field] = raw.str.strip().astype(object).where(raw != "", None)
+
+        # Loan amount in cents; unparseable values become NaN -> None
+        cleaned = mapped["loan_amount"].str.replace(_LOAN_CLEAN_RE, "", regex=True)
+        parsable = cleaned.str.fullmatch(_LOAN_NUMBER_RE).eq(True)
+        cents = cleaned[parsable].astype("float64").mul(100)
+        loan_cents = cents.reindex(mapped.index).tolist()
+
+        if self.config.retain_raw_data:
+            raw_rows = df.to_dict("records")
+        else:
+            keep = [c for c in self.RAW_DATA_KEYS if c in df.columns]
+            if keep:
+                raw_rows = df[keep].to_dict("records")
+            else:
+                raw_rows = [{} for _ in range(len(mapped))]
+        return [
+            ParsedLead(
+                row_number=idx + 2,  # Header is row 1
+                first_name=first_name,
+                last_name=last_name,
+                email=email,
+                phone=phone,
+                property_address=property_address,
+                property_city=property_city,
+                property_state=property_state,
+                property_zip=property_zip,
+                propertyreach_url=propertyreach_url,
+                loan_amount=int(amount) if amount == amount else None,
+                raw_data=raw,
+            )
+            for (
+                idx, first_name, last_name, email, phone, property_address,
+                property_city, property_state, property_zip, propertyreach_url,
+            ), amount, raw in zip(
+                mapped[[
+                    "first_name", "last_name", "email", "phone", "property_address",
+                    "property_city", "property_state", "property_zip", "propertyreach_url",
+                ]].itertuples(name=None),
+                loan_cents,
+                raw_rows,
+            )
+        ]
+
+    def _parse_csv_rows(self, content: str) -> list[ParsedLead]:
+        """Parse CSV content row by row with csv.DictReader."""
         leads = []
         reader = csv.DictReader(io.StringIO(content))
 
@@ -315,41 +683,62 @@ class IngestService:
 
         return leads
 
-    def _parse_excel_sheet(self, sheet: Any) -> list[ParsedLead]:
-        """Parse Excel sheet into leads."""
-        leads = []
-        rows = list(sheet.iter_rows(values_only=True))
+    @staticmethod
+    def _normalize_calamine_cell(value: Any) -> Any:
+        """Match openpyxl cell values: calamine reads every number as float."""
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
 
-        if not rows:
-            return leads
+    def _parse_excel_sheet(self, rows: Iterable[Sequence[Any]]) -> Iterator[ParsedLead]:
+        """Lazily parse Excel sheet rows (native cell values) into leads."""
+        it = iter(rows)
 
         # First row is header
-        headers = [str(cell).strip().lower() if cell else "" for cell in rows[0]]
+        header_row = next(it, None)
+        if header_row is None:
+            return
+        headers = [str(cell).strip().lower() if cell else "" for cell in header_row]
         column_map = self._map_columns(headers)
 
-        for row_num, row in enumerate(rows[1:], start=2):
-            row_dict = {headers[i]: row[i] for i in range(len(headers)) if i < len(row)}
-            lead = self._row_to_lead(row_num, row_dict, column_map)
+        for row_num, row in enumerate(it, start=2):
+            lead = self._row_to_lead(row_num, dict(zip(headers, row)), column_map)
             if lead:
-                leads.append(lead)
-
-        return leads
+                yield lead
 
     def _map_columns(self, headers: list[str]) -> dict[str, str]:
-        """Map file columns to expected fields."""
-        column_map = {}
-        headers_lower = [h.lower().strip() if h else "" for h in headers]
-
-        for field, aliases in self.COLUMN_MAPPINGS.items():
-            for alias in aliases:
-                if alias in headers_lower:
-                    # Find the original header name
-                    idx = headers_lower.index(alias)
-                    column_map[field] = headers[idx] if idx < len(headers) else alias
-                    break
+        """Map file columns to expected fields.
+
+        Single pass over the headers. When several headers match a field, the
+        earliest alias in COLUMN_MAPPINGS wins, then the leftmost header.
+        """
+        column_map: dict[str, str] = {}
+        ranks: dict[str, int] = {}
+
+        for header in headers:
+            match = self._ALIAS_TO_FIELD.get(header.lower().strip() if header else "")
+            if match is None:
+                continue
+            field, rank = match
+            if field not in ranks or rank < ranks[field]:
+                ranks[field] = rank
+                column_map[field] = header
 
         return column_map
 
+    @staticmethod
+    def _cell_value(row: dict[str, Any], col: str | None) -> str | None:
+        """Stripped text of `row[col]`, or None when the column is unmapped or empty."""
+        if not col:
+            return None
+        if col not in row:
+            # Also try lowercase
+            col = col.lower()
+            if col not in row:
+                return None
+        val = row[col]
+        return str(val).strip() if val else None
+
     def _row_to_lead(
         self,
         row_num: int,
@@ -357,21 +746,12 @@ class IngestService:
         column_map: dict[str, str],
     ) -> ParsedLead | None:
         """Convert row to ParsedLead."""
-        def get_value(field: str) -> str | None:
-            col = column_map.get(field)
-            if col and col in row:
-                val = row[col]
-                return str(val).strip() if val else None
-            # Also try lowercase
-            col_lower = col.lower() if col else None
-            if col_lower and col_lower in row:
-                val = row[col_lower]
-                return str(val).strip() if val else None
-            return None
+        cell = self._cell_value
+        get_col = column_map.get
 
-        first_name = get_value("first_name")
-        last_name = get_value("last_name")
-        email = get_value("email")
+        first_name = cell(row, get_col("first_name"))
+        last_name = cell(row, get_col("last_name"))
+        email = cell(row, get_col("email"))
 
         # Skip rows without required fields
         if not first_name or not last_name or not email:
@@ -379,11 +759,11 @@ class IngestService:
 
         # Parse loan amount
         loan_amount = None
-        loan_amt_str = get_value("loan_amount")
+        loan_amt_str = cell(row, get_col("loan_amount"))
         if loan_amt_str:
             try:
                 # Remove $, commas, etc
-                cleaned = re.sub(r"[^\d.]", "", loan_amt_str)
+                cleaned = _clean_loan_amount(loan_amt_str)
                 loan_amount = int(float(cleaned) * 100)  # Convert to cents
             except ValueError:
                 pass
@@ -393,14 +773,16 @@ class IngestService:
             first_name=first_name,
             last_name=last_name,
             email=email,
-            phone=get_value("phone"),
-            property_address=get_value("property_address"),
-            property_city=get_value("property_city"),
-            property_state=get_value("property_state"),
-            property_zip=get_value("property_zip"),
-            propertyreach_url=get_value("propertyreach_url"),
+            phone=cell(row, get_col("phone")),
+            property_address=cell(row, get_col("property_address")),
+            property_city=cell(row, get_col("property_city")),
+            property_state=cell(row, get_col("property_state")),
+            property_zip=cell(row, get_col("property_zip")),
+            propertyreach_url=cell(row, get_col("propertyreach_url")),
             loan_amount=loan_amount,
-            raw_data=dict(row),
+            raw_data=dict(row) if self.config.retain_raw_data else {
+                key: row[key] for key in self.RAW_DATA_KEYS if key in row
+            },
         )
 
     # Standard rate for all DSCR calculations
@@ -578,7 +960,9 @@ class IngestService:
             logger.info(f"{'='*60}")
 
             # Step 4: Fetch AVM with fallback chain (RentCast -> DataTree -> PropertyReach)
-            logger.info(f"[STEP 4] Fetching AVM (fallback chain: RentCast -> DataTree -> PropertyReach)")
+            logger.info(
+                "[STEP 4] Fetching AVM (fallback chain: RentCast -> DataTree -> PropertyReach)"
+            )
             property_value = processed.property_data.get("estimated_value", 0) if processed.property_data else 0
             avm_result = await self._fetch_avm_with_fallback(address, processed.property_data)
             if avm_result:
@@ -593,10 +977,13 @@ class IngestService:
                     f"(confidence: {avm_result.confidence}, source: {avm_result.source})"
                 )
             else:
-                logger.warning(f"[STEP 4] ✗ AVM fetch failed - no result from any source")
+                logger.warning("[STEP 4] ✗ AVM fetch failed - no result from any source")
 
             # Step 5: Fetch rent with fallback chain (RentCast -> PropertyReach -> Zillow)
-            logger.info(f"[STEP 5] Fetching rent estimate (fallback chain: RentCast -> PropertyReach -> Zillow)")
+            logger.info(
+                "[STEP 5] Fetching rent estimate "
+                "(fallback chain: RentCast -> PropertyReach -> Zillow)"
+            )
             rent_result = await self._fetch_rent_with_fallback(
                 address, processed.property_data, property_db_id=property_db_id
             )
@@ -611,10 +998,10 @@ class IngestService:
                     f"(comps: {rent_result.comp_count}, source: {rent_result.source})"
                 )
             else:
-                logger.warning(f"[STEP 5] ✗ Rent fetch failed - no result from any source")
+                logger.warning("[STEP 5] ✗ Rent fetch failed - no result from any source")
 
             # Step 5b: Run parallel verification against Zillow/Redfin
-            logger.info(f"[STEP 5b] Running parallel verification (Zillow + Redfin)")
+            logger.info("[STEP 5b] Running parallel verification (Zillow + Redfin)")
             if avm_result and rent_result:
                 avm_verifications, rent_verifications = await self._run_parallel_verification(
                     address, avm_result.value, rent_result.estimate
@@ -642,11 +1029,11 @@ class IngestService:
                             f"(found: ${v.found_value if v.found_value else 0:,}/mo, diff: {v.diff_pct}%)"
                         )
             else:
-                logger.info(f"[STEP 5b] Skipping verification - missing AVM or rent data")
+                logger.info("[STEP 5b] Skipping verification - missing AVM or rent data")
 
             # Step 6: Determine loan amount
             # Priority: DataTree lien balance > calculated max (no Encompass)
-            logger.info(f"[STEP 6] Determining loan amount")
+            logger.info("[STEP 6] Determining loan amount")
             datatree_lien_balance = processed.property_data.get("total_loan_balance", 0) if processed.property_data else 0
             loan_amount_source = "Calculated"
 
@@ -666,7 +1053,7 @@ class IngestService:
                 logger.info(f"[STEP 6] Calculated loan amount: ${loan_amount_cents / 100:,.0f} ({loan_purpose})")
 
             # Step 7: Calculate DSCR with the determined loan amount
-            logger.info(f"[STEP 7] Calculating DSCR")
+            logger.info("[STEP 7] Calculating DSCR")
             rentcast_monthly_cents = rent_estimate * 100 if rent_estimate else 0
             dscr_result = await self._calculate_dscr_with_amount(
                 loan_amount_cents, processed.property_data,
@@ -700,7 +1087,7 @@ class IngestService:
                     f"[STEP 7]   Meets minimum ({self.config.min_dscr}): {'YES' if processed.dscr_meets_minimum else 'NO'}"
                 )
             else:
-                logger.warning(f"[STEP 7] ✗ DSCR calculation failed")
+                logger.warning("[STEP 7] ✗ DSCR calculation failed")
 
             # Compute LTV early (needed for Step 7b premium verification check)
             if property_value and property_value > 0:
@@ -710,7 +1097,7 @@ class IngestService:
 
             # Step 7b: Fetch premium AVM from Clear Capital if deal qualifies
             # Triggers when: DSCR > threshold AND LTV > threshold
-            logger.info(f"[STEP 7b] Evaluating Clear Capital premium verification")
+            logger.info("[STEP 7b] Evaluating Clear Capital premium verification")
             simple_dscr_for_check = processed.simple_dscr_ratio or processed.dscr_ratio or 0
             avm_verifications = sources.avm_verified_by or []
             rent_verifications = sources.rent_verified_by or []
@@ -718,7 +1105,7 @@ class IngestService:
             # Log the evaluation criteria
             dscr_ok = simple_dscr_for_check > self.config.premium_dscr_threshold
             ltv_ok = ltv < self.config.premium_ltv_threshold  # LTV must be below max
-            logger.info(f"[STEP 7b] Evaluation criteria:")
+            logger.info("[STEP 7b] Evaluation criteria:")
             logger.info(f"[STEP 7b]   DSCR: {simple_dscr_for_check:.2f} {'>' if dscr_ok else '<='} {self.config.premium_dscr_threshold} {'✓' if dscr_ok else '✗'}")
             logger.info(f"[STEP 7b]   LTV: {ltv:.1f}% {'<' if ltv_ok else '>='} {self.config.premium_ltv_threshold}% {'✓' if ltv_ok else '✗'}")
 
@@ -754,7 +1141,9 @@ class IngestService:
                         else:
                             logger.info(f"[STEP 7b] Primary AVM is lower, keeping ${avm_result.value / 100:,.0f}")
                     else:
-                        logger.info(f"[STEP 7b] AVM values are within 10% tolerance - no adjustment needed")
+                        logger.info(
+                            "[STEP 7b] AVM values are within 10% tolerance - no adjustment needed"
+                        )
 
                     # Track if we need to recalculate DSCR
                     recalc_dscr = False
@@ -787,12 +1176,12 @@ class IngestService:
                                 )
                                 sources.rent_source = "Conservative (RentCast vs ClearCapital)"
                             else:
-                                logger.info(f"[STEP 7b] Rent values within 15% tolerance")
+                                logger.info("[STEP 7b] Rent values within 15% tolerance")
                         else:
                             # No RentCast rent, use Clear Capital
                             final_rent = cc_rent
                             sources.rent_source = "ClearCapital:RentalAVM"
-                            logger.info(f"[STEP 7b] Using Clear Capital rent (no RentCast data)")
+                            logger.info("[STEP 7b] Using Clear Capital rent (no RentCast data)")
                         recalc_dscr = True
 
                     # Recalculate DSCR with updated rent and/or taxes from Clear Capital
@@ -865,9 +1254,15 @@ class IngestService:
                             processed.rental_comps = cc_rental_comps
                             logger.info(f"[STEP 7b] ✓ Stored {len(processed.rental_comps)} rental comps from Clear Capital")
                         else:
-                            logger.info(f"[STEP 7b] Clear Capital rental comps filtered out, keeping RentCast comps")
+                            logger.info(
+                                "[STEP 7b] Clear Capital rental comps filtered out, "
+                                "keeping RentCast comps"
+                            )
                 else:
-                    logger.info(f"[STEP 7b] Clear Capital not called (conditions not met or not configured)")
+                    logger.info(
+                        "[STEP 7b] Clear Capital not called "
+                        "(conditions not met or not configured)"
+                    )
 
             # Step 8: LTV already computed above (before Step 7b)
             # Recalculate if property_value changed due to premium AVM divergence
@@ -980,14 +1375,14 @@ class IngestService:
                     lead_db_id, processed, encompass_guid, address
                 )
 
-            processed.processed_at = datetime.now(timezone.utc)
+            processed.processed_at = datetime.now(UTC)
 
             # ============ PIPELINE SUMMARY ============
             logger.info(f"{'='*60}")
             logger.info(f"[SUMMARY] Pipeline Complete: {addr_str}")
             logger.info(f"{'='*60}")
             logger.info(f"[SUMMARY] Status: {processed.status.value}")
-            logger.info(f"[SUMMARY] Data Sources:")
+            logger.info("[SUMMARY] Data Sources:")
             logger.info(f"[SUMMARY]   Property: {sources.property_source}")
             logger.info(f"[SUMMARY]   AVM: {sources.avm_source} (${processed.avm_value / 100 if processed.avm_value else 0:,.0f})")
             logger.info(f"[SUMMARY]   Rent: {sources.rent_source} (${processed.rent_estimate or 0:,}/mo)")
@@ -995,7 +1390,7 @@ class IngestService:
             # Verification summary
             avm_verified = any(v.match for v in (sources.avm_verified_by or []) if not v.error)
             rent_verified = any(v.match for v in (sources.rent_verified_by or []) if not v.error)
-            logger.info(f"[SUMMARY] Verification:")
+            logger.info("[SUMMARY] Verification:")
             logger.info(f"[SUMMARY]   AVM verified: {'YES' if avm_verified else 'NO'}")
             logger.info(f"[SUMMARY]   Rent verified: {'YES' if rent_verified else 'NO'}")
 
@@ -1003,10 +1398,10 @@ class IngestService:
             if sources.premium_avm:
                 logger.info(f"[SUMMARY]   Premium AVM: {sources.premium_avm.source} (${sources.premium_avm.value / 100:,.0f})")
             else:
-                logger.info(f"[SUMMARY]   Premium AVM: Not triggered")
+                logger.info("[SUMMARY]   Premium AVM: Not triggered")
 
             # DSCR/LTV
-            logger.info(f"[SUMMARY] Metrics:")
+            logger.info("[SUMMARY] Metrics:")
             logger.info(f"[SUMMARY]   DSCR: {processed.simple_dscr_ratio or 0:.4f}")
             logger.info(f"[SUMMARY]   LTV: {ltv:.1f}%")
             logger.info(f"[SUMMARY]   Loan Amount: ${loan_amount_cents / 100:,.0f}")
@@ -1017,14 +1412,14 @@ class IngestService:
             elif processed.dscr_meets_minimum:
                 logger.info(f"[SUMMARY] Decision: APPROVED (DSCR >= {self.config.min_dscr})")
             else:
-                logger.info(f"[SUMMARY] Decision: PENDING REVIEW")
+                logger.info("[SUMMARY] Decision: PENDING REVIEW")
             logger.info(f"{'='*60}")
 
         except Exception as e:
             logger.error(f"[PIPELINE] ✗ FAILED: {e}")
             processed.status = LeadProcessingStatus.FAILED
             processed.error_message = str(e)
-            processed.processed_at = datetime.now(timezone.utc)
+            processed.processed_at = datetime.now(UTC)
 
         return processed
 
@@ -1047,36 +1442,45 @@ class IngestService:
 
         return None
 
-    def _parse_propertyreach_url(self, url: str) -> PropertyReachAddress | None:
-        """Parse PropertyReach URL to extract address."""
-        try:
-            parsed = urlparse(url)
-            params = parse_qs(parsed.query)
-
-            # PropertyReach URL format varies, try common patterns
-            # Example: https://propertyreach.com/property?address=123+Main+St&city=Austin&state=TX&zip=78701
-            street = params.get("address", params.get("street", [None]))[0]
-            city = params.get("city", [None])[0]
-            state = params.get("state", [None])[0]
-            zip_code = params.get("zip", params.get("zipcode", [None]))[0]
-
-            if street and city and state and zip_code:
-                return PropertyReachAddress(
-                    street=street.replace("+", " "),
-                    city=city.replace("+", " "),
-                    state=state,
-                    zip=zip_code,
-                )
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_propertyreach_url(url: str) -> PropertyReachAddress | None:
+        """Parse PropertyReach URL to extract address (memoized per URL).
 
-            # Try parsing from path
-            # Example: https://propertyreach.com/property/123-main-st-austin-tx-78701
-            path_parts = parsed.path.strip("/").split("/")
-            if len(path_parts) >= 2 and path_parts[0] == "property":
-                # This would need more sophisticated parsing
-                pass
+        Splits the query by hand and decodes only the address keys, with the
+        same rules as parse_qs (first value wins, blank values are ignored).
+        """
+        # PropertyReach URL format varies, try common patterns
+        # Example: https://propertyreach.com/property?address=123+Main+St&city=Austin&state=TX&zip=78701
+        # Path-style URLs (/property/123-main-st-austin-tx-78701) are not parsed.
+        if "?" not in url:
+            return None
 
-        except Exception:
-            pass
+        _, sep, query = url.split("#", 1)[0].partition("?")
+        if not sep:
+            return None
+        params: dict[str, str] = {}
+        for pair in query.split("&"):
+            name, sep, value = pair.partition("=")
+            if not sep or not value:
+                continue
+            if "%" in name or "+" in name:
+                name = unquote_plus(name)
+            if name in _URL_ADDRESS_KEYS and name not in params:
+                params[name] = unquote_plus(value)
+
+        street = params.get("address") or params.get("street")
+        city = params.get("city")
+        state = params.get("state")
+        zip_code = params.get("zip") or params.get("zipcode")
+
+        if street and city and state and zip_code:
+            return PropertyReachAddress(
+                street=street.replace("+", " "),
+                city=city.replace("+", " "),
+                state=state,
+                zip=zip_code,
+            )
 
         return None
 
@@ -1149,12 +1553,111 @@ class IngestService:
         except RuntimeError:
             pass  # DB not configured
 
+    @staticmethod
+    def _address_key(address: PropertyReachAddress) -> tuple[str, str, str, str]:
+        """Normalized (street, city, state, zip) used to dedupe address lookups."""
+        return (
+            address.street.upper().strip(),
+            address.city.upper().strip(),
+            address.state.upper().strip(),
+            address.zip.upper().strip(),
+        )
+
+    async def _single_flight(
+        self,
+        cache: TTLCache[tuple[str, str, str, str], Any],
+        inflight: dict[tuple[str, str, str, str], asyncio.Future[Any]],
+        key: tuple[str, str, str, str],
+        fetch: Callable[[], Awaitable[Any]],
+        is_hit: Callable[[Any], bool],
+    ) -> Any:
+        """Return a cached lookup, or join/start the in-flight request for `key`.
+
+        Only results accepted by `is_hit` are cached, so misses and transient
+        API failures are retried by the next lead with the same address.
+        Requests are only shared within one event loop.
+        """
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+        task = inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fetch())
+            inflight[key] = task
+
+            def finish(done: asyncio.Future[Any]) -> None:
+                if inflight.get(key) is done:
+                    del inflight[key]
+                if not done.cancelled() and done.exception() is None:
+                    if is_hit(done.result()):
+                        cache.put(key, done.result())
+
+            task.add_done_callback(finish)
+
+        return await asyncio.shield(task)
+
     async def _fetch_property_data(
         self, address: PropertyReachAddress
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """Fetch property data from PropertyReach, memoized per address.
+
+        Returns (parsed_data, raw_response). parsed_data is a shallow copy because
+        the pipeline updates it in place (e.g. liens from DataTree).
+        """
+        data, raw = await self._single_flight(
+            self._property_cache,
+            self._property_inflight,
+            self._address_key(address),
+            lambda: self._fetch_property_data_uncached(address),
+            lambda result: result[0] is not None,
+        )
+        return (dict(data) if data is not None else None), raw
+
+    async def _prefetch_property_data(self, leads: list[ParsedLead]) -> None:
+        """Warm the PropertyReach cache for every unique lead address, in shards.
+
+        Each shard shares one pooled HTTP client; _process_lead then reads the
+        cached result instead of opening a connection per lead.
+        """
+        if not property_reach.is_configured():
+            return
+
+        pending: dict[tuple[str, str, str, str], PropertyReachAddress] = {}
+        for lead in leads:
+            address = self._extract_address(lead)
+            if address:
+                key = self._address_key(address)
+                if key not in self._property_inflight and self._property_cache.get(key) is None:
+                    pending.setdefault(key, address)
+
+        items = list(pending.items())
+        size = self.config.prefetch_batch_size
+        for start in range(0, len(items), size):
+            shard = items[start:start + size]
+            reports = await property_reach.get_property_reports([a for _, a in shard])
+            for (key, _), report in zip(shard, reports):
+                result = self._property_report_to_data(report)
+                # Misses are left uncached so the per-lead path retries them
+                if result[0] is not None and self._property_cache.get(key) is None:
+                    self._property_cache.put(key, result)
+
+    async def _fetch_property_data_uncached(
+        self, address: PropertyReachAddress
     ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
         """Fetch property data from PropertyReach. Returns (parsed_data, raw_response)."""
         try:
             report = await property_reach.get_property_report(address)
+        except Exception as e:
+            logger.warning("PropertyReach fetch failed: %s", e, exc_info=True)
+            return None, None
+        return self._property_report_to_data(report)
+
+    def _property_report_to_data(
+        self, report: Any
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """Flatten a PropertyReach report into (parsed_data, raw_response)."""
+        try:
             if report:
                 raw = report.raw_data or {}
 
@@ -1226,7 +1729,7 @@ class IngestService:
                     "source": "PropertyReach",
                 }, raw
         except Exception as e:
-            print(f"PropertyReach fetch failed: {e}")
+            logger.warning("PropertyReach fetch failed: %s", e, exc_info=True)
         return None, None
 
     def _create_default_property_data(
@@ -1261,21 +1764,34 @@ class IngestService:
                 else:
                     monthly_rent = property_data.get("monthly_rent_estimate", 0)
 
-            if not monthly_rent:
-                monthly_rent = 350000  # Default $3,500
+            if monthly_rent:
+                gross_rent = Money(monthly_rent)
+            else:
+                gross_rent = self._default_rent
+                monthly_rent = gross_rent.amount
 
-            # Get taxes and insurance
-            annual_taxes = property_data.get("annual_taxes", 720000) if property_data else 720000
-            est_value = override_value_cents or (property_data.get("estimated_value", 60000000) if property_data else 60000000)
-            annual_insurance = int(est_value * 0.0035)  # 0.35% of value
+            # Get taxes and insurance (insurance is a percentage of value)
+            if property_data and "annual_taxes" in property_data:
+                annual_taxes = Money(property_data["annual_taxes"])
+            else:
+                annual_taxes = self._default_annual_taxes
+
+            if override_value_cents:
+                annual_insurance = Money(int(override_value_cents * self.config.insurance_rate))
+            elif property_data and "estimated_value" in property_data:
+                annual_insurance = Money(
+                    int(property_data["estimated_value"] * self.config.insurance_rate)
+                )
+            else:
+                annual_insurance = self._default_annual_insurance
 
             input_data = DSCRCalculationInput(
                 application_id="ingest",
                 property_id="ingest",
-                gross_monthly_rent=Money(monthly_rent),
+                gross_monthly_rent=gross_rent,
                 vacancy_rate=self.config.default_vacancy_rate,
-                annual_property_tax=Money(annual_taxes),
-                annual_insurance=Money(annual_insurance),
+                annual_property_tax=annual_taxes,
+                annual_insurance=annual_insurance,
                 loan_amount=Money(loan_amount_cents),
                 interest_rate=self.config.default_interest_rate / 100,
                 term_months=self.config.default_loan_term_months,
@@ -1292,10 +1808,21 @@ class IngestService:
             }
 
         except Exception as e:
-            print(f"DSCR calculation failed: {e}")
+            logger.warning("DSCR calculation failed: %s", e, exc_info=True)
             return None
 
     async def _fetch_avm(self, address: PropertyReachAddress, loan_amount_cents: int = 40000000) -> dict[str, Any] | None:
+        """Fetch AVM data from DataTree, memoized per address."""
+        result = await self._single_flight(
+            self._avm_cache,
+            self._avm_inflight,
+            self._address_key(address),
+            lambda: self._fetch_avm_uncached(address),
+            lambda result: result is not None,
+        )
+        return dict(result) if result is not None else None
+
+    async def _fetch_avm_uncached(self, address: PropertyReachAddress) -> dict[str, Any] | None:
         """Fetch AVM data from DataTree (primary).
 
         Note: DataTree requires specific products to be enabled on the account.
@@ -1317,7 +1844,7 @@ class IngestService:
             if result.get("success") and result.get("report"):
                 report = result["report"]
                 if report.estimated_value:
-                    print(f"DataTree AVM: ${report.estimated_value / 100:,.0f}")
+                    logger.info(f"DataTree AVM: ${report.estimated_value / 100:,.0f}")
                     return {
                         "value": report.estimated_value,
                         "confidence": report.confidence_level.value if report.confidence_level else None,
@@ -1326,14 +1853,14 @@ class IngestService:
                         "source": "DataTree",
                     }
                 else:
-                    print("DataTree AVM: No value in response")
+                    logger.info("DataTree AVM: No value in response")
             else:
                 error_msg = result.get("error", {}).get("message", "Unknown error")
                 # Don't spam logs with "unauthorized product" since that's expected until account is configured
                 if "unauthorized" not in error_msg.lower():
-                    print(f"DataTree AVM failed: {error_msg}")
+                    logger.warning("DataTree AVM failed: %s", error_msg)
         except Exception as e:
-            print(f"DataTree AVM error: {e}")
+            logger.warning("DataTree AVM error: %s", e, exc_info=True)
 
         return None
 
@@ -1373,7 +1900,7 @@ class IngestService:
                     "source": "RentCast",
                 }
         except Exception as e:
-            print(f"RentCast value estimate failed: {e}")
+            logger.warning("RentCast value estimate failed: %s", e, exc_info=True)
         return None
 
     async def _fetch_avm_with_fallback(
@@ -1389,7 +1916,7 @@ class IngestService:
         logger.debug(f"[AVM] Starting fallback chain for {address.street}")
 
         # Try RentCast first (now returns AVMResult directly)
-        logger.debug(f"[AVM] Trying RentCast...")
+        logger.debug("[AVM] Trying RentCast...")
         result = await rentcast_service.get_value_estimate(
             address=address.street,
             city=address.city,
@@ -1403,10 +1930,10 @@ class IngestService:
         if result:
             logger.info(f"[AVM] ✓ RentCast: ${result.value / 100:,.0f} (confidence: {result.confidence})")
             return result
-        logger.debug(f"[AVM] ✗ RentCast returned no result")
+        logger.debug("[AVM] ✗ RentCast returned no result")
 
         # Fallback to DataTree
-        logger.debug(f"[AVM] Trying DataTree (fallback 1)...")
+        logger.debug("[AVM] Trying DataTree (fallback 1)...")
         dt_result = await self._fetch_avm(address, loan_amount_cents=25000000)
         if dt_result and dt_result.get("value"):
             logger.info(f"[AVM] ✓ DataTree (fallback): ${dt_result['value'] / 100:,.0f}")
@@ -1417,10 +1944,10 @@ class IngestService:
                 confidence=dt_result.get("confidence"),
                 source="DataTree",
             )
-        logger.debug(f"[AVM] ✗ DataTree returned no result")
+        logger.debug("[AVM] ✗ DataTree returned no result")
 
         # Final fallback: PropertyReach assessed value
-        logger.debug(f"[AVM] Trying PropertyReach assessed value (fallback 2)...")
+        logger.debug("[AVM] Trying PropertyReach assessed value (fallback 2)...")
         if property_data and property_data.get("assessed_value"):
             assessed = property_data["assessed_value"]
             logger.info(f"[AVM] ✓ PropertyReach assessed (fallback): ${assessed / 100:,.0f}")
@@ -1446,7 +1973,7 @@ class IngestService:
         logger.debug(f"[RENT] Starting fallback chain for {address.street}")
 
         # Try RentCast first
-        logger.debug(f"[RENT] Trying RentCast...")
+        logger.debug("[RENT] Trying RentCast...")
         result = await rentcast_service.get_rent_estimate(
             address=address.street,
             city=address.city,
@@ -1483,10 +2010,10 @@ class IngestService:
                 source="RentCast",
                 raw_data=result.raw_data,
             )
-        logger.debug(f"[RENT] ✗ RentCast returned no result")
+        logger.debug("[RENT] ✗ RentCast returned no result")
 
         # Fallback to PropertyReach estimate
-        logger.debug(f"[RENT] Trying PropertyReach (fallback 1)...")
+        logger.debug("[RENT] Trying PropertyReach (fallback 1)...")
         if property_data and property_data.get("monthly_rent_estimate"):
             rent = int(property_data["monthly_rent_estimate"] / 100)
             logger.info(f"[RENT] ✓ PropertyReach (fallback): ${rent:,}/mo")
@@ -1494,10 +2021,10 @@ class IngestService:
                 estimate=rent,
                 source="PropertyReach",
             )
-        logger.debug(f"[RENT] ✗ PropertyReach has no rent estimate")
+        logger.debug("[RENT] ✗ PropertyReach has no rent estimate")
 
         # Final fallback: Zillow scrape
-        logger.debug(f"[RENT] Trying Zillow scrape (fallback 2)...")
+        logger.debug("[RENT] Trying Zillow scrape (fallback 2)...")
         try:
             v = await zillow_scraper.verify_rent(
                 address.street, address.city, address.state, address.zip, 0
@@ -1508,11 +2035,11 @@ class IngestService:
                     estimate=v.found_value,
                     source="Zillow",
                 )
-            logger.debug(f"[RENT] ✗ Zillow scrape found no value")
+            logger.debug("[RENT] ✗ Zillow scrape found no value")
         except Exception as e:
             logger.warning(f"[RENT] ✗ Zillow rent fallback failed: {e}")
 
-        logger.warning(f"[RENT] All fallbacks exhausted - no rent estimate available")
+        logger.warning("[RENT] All fallbacks exhausted - no rent estimate available")
         return None
 
     async def _run_parallel_verification(
@@ -1526,9 +2053,7 @@ class IngestService:
 
         Returns (avm_verifications, rent_verifications).
         """
-        import asyncio
-
-        logger.debug(f"[VERIFY] Starting parallel verification (Zillow + Redfin)")
+        logger.debug("[VERIFY] Starting parallel verification (Zillow + Redfin)")
         logger.debug(f"[VERIFY] Expected AVM: ${avm_value / 100:,.0f} | Expected Rent: ${rent_estimate:,}/mo")
 
         # Build verification tasks
@@ -1550,7 +2075,7 @@ class IngestService:
         task_names = ["Zillow AVM", "Zillow Rent", "Redfin AVM", "Redfin Rent"]
 
         # Run all verification tasks in parallel
-        logger.debug(f"[VERIFY] Running 4 verification tasks in parallel...")
+        logger.debug("[VERIFY] Running 4 verification tasks in parallel...")
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         avm_verifications: list[VerificationResult] = []
@@ -1698,7 +2223,11 @@ class IngestService:
                 lien_info = ""
                 if report.existing_loans:
                     lien_info = f", {report.mortgage_count} liens (${report.total_loan_balance / 100 if report.total_loan_balance else 0:,.0f})"
-                print(f"DataTree property: {report.square_feet} sqft, {report.bedrooms} bed, {report.bathrooms} bath, taxes ${report.annual_taxes / 100 if report.annual_taxes else 0:,.0f}/yr{lien_info}")
+                taxes_dollars = report.annual_taxes / 100 if report.annual_taxes else 0
+                logger.info(
+                    f"DataTree property: {report.square_feet} sqft, {report.bedrooms} bed, "
+                    f"{report.bathrooms} bath, taxes ${taxes_dollars:,.0f}/yr{lien_info}"
+                )
                 return {
                     "property_type": report.property_type or "SFR",
                     "year_built": report.year_built,
@@ -1717,7 +2246,7 @@ class IngestService:
                     "source": "DataTree",
                 }
         except Exception as e:
-            print(f"DataTree property fetch failed: {e}")
+            logger.warning("DataTree property fetch failed: %s", e, exc_info=True)
         return None
 
     async def _fetch_liens_from_datatree(
@@ -1735,7 +2264,10 @@ class IngestService:
 
             if result and result.get("liens"):
                 liens = result["liens"]
-                print(f"DataTree liens: Found {len(liens)} liens, total ${result.get('combined_balance_cents', 0) / 100:,.0f}")
+                logger.info(
+                    f"DataTree liens: Found {len(liens)} liens, "
+                    f"total ${result.get('combined_balance_cents', 0) / 100:,.0f}"
+                )
 
                 # Store raw response
                 if result.get("raw_data") and property_db_id:
@@ -1772,9 +2304,9 @@ class IngestService:
                     })
                 return existing_loans
             else:
-                print("DataTree liens: No liens found or API returned empty")
+                logger.info("DataTree liens: No liens found or API returned empty")
         except Exception as e:
-            print(f"DataTree liens fetch failed: {e}")
+            logger.warning("DataTree liens fetch failed: %s", e, exc_info=True)
         return []
 
     def _calculate_piti_breakdown(
@@ -1828,7 +2360,7 @@ class IngestService:
         monthly_taxes = annual_taxes / 12
 
         # Annual insurance: 0.35% of property value
-        annual_insurance = property_value * 0.0035
+        annual_insurance = property_value * self.config.insurance_rate
         monthly_insurance = annual_insurance / 12
 
         # Total PITIA
@@ -1905,7 +2437,7 @@ class IngestService:
                     "comps": comps,
                 }
         except Exception as e:
-            print(f"RentCast fetch failed: {e}")
+            logger.warning("RentCast fetch failed: %s", e, exc_info=True)
         return None
 
     async def _persist_property(
@@ -1973,7 +2505,7 @@ class IngestService:
     ) -> tuple[str, str, str]:
         """Persist lead, borrower, and application. Returns (lead_id, borrower_id, app_id)."""
         try:
-            from app.db.repositories import lead_repo, borrower_repo, application_repo
+            from app.db.repositories import application_repo, borrower_repo, lead_repo
 
             lead_row = await lead_repo.create(
                 first_name=lead.first_name,
@@ -2068,7 +2600,6 @@ class IngestService:
     ) -> None:
         """Persist full analysis data to lead record for dashboard display."""
         try:
-            import json
             from app.db.repositories import lead_repo
 
             analysis = {
@@ -2149,7 +2680,6 @@ class IngestService:
         Pulls loan data from Encompass API and compares with pipeline results.
         """
         try:
-            import json
             from app.db.repositories import lead_repo
 
             # Pull Encompass data
@@ -2262,7 +2792,7 @@ class IngestService:
         loan_purpose: str = "PURCHASE",
     ) -> dict[str, str]:
         """Create an offer for a qualifying lead and persist to DB."""
-        offer_token = f"offer_{uuid4().hex[:12]}"
+        offer_token = f"offer_{secrets.token_urlsafe(9)}"
 
         # Build offer data in camelCase with dollar amounts for frontend
         loan_amount_dollars = loan_amount_cents / 100
@@ -2314,7 +2844,6 @@ class IngestService:
         }
 
         # Persist to DB
-        offer_id = str(uuid4())
         try:
             from app.db.repositories import offer_repo
             row = await offer_repo.create(
@@ -2329,7 +2858,7 @@ class IngestService:
             )
             offer_id = str(row["id"])
         except RuntimeError:
-            pass
+            offer_id = str(uuid4())  # DB not configured
 
         return {
             "id": offer_id,
@@ -9,9 +9,35 @@ Calculates loan pricing based on risk factors including:
 - Loan amount
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _build_bins(table: dict[tuple[float, float], Any]) -> tuple[tuple[float, ...], tuple[Any, ...]]:
+    """Turn a {(low, high): value} range table into (edges, values) for bisect.
+
+    Ranges must be contiguous; edges has one more entry than values.
+    """
+    ranges = sorted(table)
+    for (_, high), (low, _) in zip(ranges, ranges[1:]):
+        if high != low:
+            raise ValueError(f"Range table has a gap or overlap at {high}/{low}")
+    edges = tuple(low for low, _ in ranges) + (ranges[-1][1],)
+    return edges, tuple(table[r] for r in ranges)
+
+
+def _lookup_bin(edges: tuple[float, ...], values: tuple[Any, ...], x: float, default: Any) -> Any:
+    """Value of the half-open bin [low, high) containing x, else default."""
+    i = bisect_right(edges, x) - 1
+    if 0 <= i < len(values):
+        return values[i]
+    return default
 
 
 class RiskTier(str, Enum):
@@ -23,7 +49,21 @@ class RiskTier(str, Enum):
     HIGH_RISK = "HIGH_RISK"
 
 
-@dataclass
+# Risk-tier scoring: each factor scores 0-4 by how many thresholds it clears
+_DSCR_SCORE_THRESH = (1.00, 1.10, 1.25, 1.50)  # score = thresholds <= DSCR
+_CREDIT_SCORE_THRESH = (700, 720, 740, 760)  # score = thresholds <= credit score
+_LTV_SCORE_THRESH = (65, 70, 75, 80)  # score = thresholds >= LTV (lower is better)
+_TIER_THRESH = (2, 4, 7, 10)
+_TIERS = (
+    RiskTier.HIGH_RISK,
+    RiskTier.MARGINAL,
+    RiskTier.ACCEPTABLE,
+    RiskTier.GOOD,
+    RiskTier.EXCELLENT,
+)
+
+
+@dataclass(slots=True)
 class PricingInput:
     """Input for pricing calculation."""
     dscr: float
@@ -36,7 +76,7 @@ class PricingInput:
     is_cash_out: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PricingAdjustment:
     """Individual pricing adjustment."""
     factor: str
@@ -44,7 +84,7 @@ class PricingAdjustment:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PricingResult:
     """Pricing calculation result."""
     base_rate: float
@@ -67,6 +107,7 @@ class PricingEngine:
         RiskTier.MARGINAL: 7.75,
         RiskTier.HIGH_RISK: 8.50,
     }
+    _BASE_RATES_BY_TIER = tuple(map(BASE_RATES.__getitem__, _TIERS))  # indexed like _TIERS
 
     # DSCR adjustments (bps)
     DSCR_ADJUSTMENTS = {
@@ -108,14 +149,25 @@ class PricingEngine:
         "MULTIFAMILY_5PLUS": 125,
     }
 
+    # Sorted bin edges and per-bin bps for bisect lookups, derived from the tables above
+    _DSCR_EDGES, _DSCR_BPS = _build_bins(DSCR_ADJUSTMENTS)
+    _LTV_EDGES, _LTV_BPS = _build_bins(LTV_ADJUSTMENTS)
+    _CREDIT_EDGES, _CREDIT_BPS = _build_bins(CREDIT_ADJUSTMENTS)
+
     # Minimum requirements
     MIN_DSCR = 0.75  # No ratio allowed
     MIN_CREDIT_SCORE = 660
     MAX_LTV = 80
 
+    def __init__(self) -> None:
+        # Repricing runs see the same borrower inputs many times; the
+        # adjustment tables are step functions, so the terms can be reused.
+        self._pricing_terms = lru_cache(maxsize=65536)(self._compute_pricing_terms)
+
     def calculate_pricing(self, input_data: PricingInput) -> PricingResult:
         """Calculate loan pricing."""
         adjustments: list[PricingAdjustment] = []
+        total_adjustment_bps = 0
         ineligibility_reasons: list[str] = []
 
         # Check eligibility
@@ -128,13 +180,14 @@ class PricingEngine:
         if input_data.dscr < self.MIN_DSCR:
             ineligibility_reasons.append(f"DSCR {input_data.dscr} below minimum {self.MIN_DSCR}")
 
-        # Determine risk tier
-        risk_tier = self._determine_risk_tier(input_data)
-        base_rate = self.BASE_RATES[risk_tier]
+        # Risk tier and table adjustments (cached per input tuple)
+        risk_tier, base_rate, dscr_adj, ltv_adj, credit_adj, prop_adj = self._pricing_terms(
+            input_data.dscr, input_data.ltv, input_data.credit_score, input_data.property_type
+        )
 
         # DSCR adjustment
-        dscr_adj = self._get_dscr_adjustment(input_data.dscr)
         if dscr_adj != 0:
+            total_adjustment_bps += dscr_adj
             adjustments.append(PricingAdjustment(
                 factor="DSCR",
                 adjustment_bps=dscr_adj,
@@ -142,8 +195,8 @@ class PricingEngine:
             ))
 
         # LTV adjustment
-        ltv_adj = self._get_ltv_adjustment(input_data.ltv)
         if ltv_adj != 0:
+            total_adjustment_bps += ltv_adj
             adjustments.append(PricingAdjustment(
                 factor="LTV",
                 adjustment_bps=ltv_adj,
@@ -151,8 +204,8 @@ class PricingEngine:
             ))
 
         # Credit adjustment
-        credit_adj = self._get_credit_adjustment(input_data.credit_score)
         if credit_adj is not None and credit_adj != 0:
+            total_adjustment_bps += credit_adj
             adjustments.append(PricingAdjustment(
                 factor="Credit Score",
                 adjustment_bps=credit_adj,
@@ -160,8 +213,8 @@ class PricingEngine:
             ))
 
         # Property type adjustment
-        prop_adj = self.PROPERTY_TYPE_ADJUSTMENTS.get(input_data.property_type, 50)
         if prop_adj != 0:
+            total_adjustment_bps += prop_adj
             adjustments.append(PricingAdjustment(
                 factor="Property Type",
                 adjustment_bps=prop_adj,
@@ -170,14 +223,14 @@ class PricingEngine:
 
         # Cash out adjustment
         if input_data.is_cash_out:
+            total_adjustment_bps += 50
             adjustments.append(PricingAdjustment(
                 factor="Cash Out",
                 adjustment_bps=50,
                 reason="Cash-out refinance",
             ))
 
-        # Calculate total
-        total_adjustment_bps = sum(a.adjustment_bps for a in adjustments)
+        # Calculate final rate
         final_rate = base_rate + (total_adjustment_bps / 100)
 
         return PricingResult(
@@ -190,73 +243,112 @@ class PricingEngine:
             ineligibility_reasons=ineligibility_reasons,
         )
 
+    def calculate_pricing_batch(self, cols: dict[str, Any]) -> dict[str, "np.ndarray"]:
+        """Price many loans at once (nightly repricing, portfolio analytics).
+
+        Expects equal-length arrays: dscr, ltv, credit_score, property_type
+        (strings), is_cash_out. Returns arrays for base_rate,
+        total_adjustment_bps, final_rate, risk_tier (tier values) and eligible,
+        matching calculate_pricing() row by row.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is required for batch pricing. Run: pip install numpy")
+
+        dscr = np.asarray(cols["dscr"], dtype=np.float64)
+        ltv = np.asarray(cols["ltv"], dtype=np.float64)
+        credit = np.asarray(cols["credit_score"], dtype=np.float64)
+        cash_out = np.asarray(cols["is_cash_out"], dtype=bool)
+
+        def bin_values(edges: tuple[float, ...], values: tuple[Any, ...], x: Any) -> Any:
+            # Same [low, high) bins as _lookup_bin; out of range (incl. NaN) -> 0
+            table = np.array([0 if v is None else v for v in values] + [0], dtype=np.int64)
+            idx = np.searchsorted(edges, x, side="right") - 1
+            return table[np.where(idx < 0, len(values), idx)]
+
+        # One dict probe per distinct property type, then an indexed gather
+        prop_types, prop_ids = np.unique(
+            np.asarray(cols["property_type"], dtype=object).astype(str), return_inverse=True
+        )
+        prop_bps = np.array(
+            [self.PROPERTY_TYPE_ADJUSTMENTS.get(p, 50) for p in prop_types], dtype=np.int16
+        )[prop_ids.reshape(-1)].astype(np.int64)
+        total_bps = (
+            bin_values(self._DSCR_EDGES, self._DSCR_BPS, dscr)
+            + bin_values(self._LTV_EDGES, self._LTV_BPS, ltv)
+            + bin_values(self._CREDIT_EDGES, self._CREDIT_BPS, credit)
+            + prop_bps
+            + np.where(cash_out, 50, 0)
+        )
+
+        # Risk tier: per-factor threshold counts, NaN scores 0
+        dscr_score = np.searchsorted(_DSCR_SCORE_THRESH, dscr, side="right")
+        credit_score = np.searchsorted(_CREDIT_SCORE_THRESH, credit, side="right")
+        ltv_score = len(_LTV_SCORE_THRESH) - np.searchsorted(_LTV_SCORE_THRESH, ltv, side="left")
+        score = (
+            credit_score
+            + np.where(np.isnan(dscr), 0, dscr_score)
+            + np.where(np.isnan(ltv), 0, ltv_score)
+        )
+        tier_idx = np.searchsorted(_TIER_THRESH, score, side="right")
+        base_rate = np.array(self._BASE_RATES_BY_TIER)[tier_idx]
+
+        # Negated failures so NaN stays eligible, as in calculate_pricing()
+        eligible = (
+            ~(credit < self.MIN_CREDIT_SCORE) & ~(ltv > self.MAX_LTV) & ~(dscr < self.MIN_DSCR)
+        )
+
+        return {
+            "base_rate": base_rate,
+            "total_adjustment_bps": total_bps,
+            "final_rate": np.round(base_rate + total_bps / 100, 3),
+            "risk_tier": np.array([t.value for t in _TIERS])[tier_idx],
+            "eligible": eligible,
+        }
+
+    def _compute_pricing_terms(
+        self, dscr: float, ltv: float, credit_score: int, property_type: str
+    ) -> tuple[RiskTier, float, int, int, int | None, int]:
+        """Risk tier, base rate and DSCR/LTV/credit/property adjustments for one input."""
+        tier_idx = self._risk_tier_index(dscr, ltv, credit_score)
+        return (
+            _TIERS[tier_idx],
+            self._BASE_RATES_BY_TIER[tier_idx],
+            self._get_dscr_adjustment(dscr),
+            self._get_ltv_adjustment(ltv),
+            self._get_credit_adjustment(credit_score),
+            self.PROPERTY_TYPE_ADJUSTMENTS.get(property_type, 50),
+        )
+
     def _determine_risk_tier(self, input_data: PricingInput) -> RiskTier:
         """Determine overall risk tier."""
-        # Simple scoring based on key factors
-        score = 0
-
-        # DSCR scoring
-        if input_data.dscr >= 1.50:
-            score += 4
-        elif input_data.dscr >= 1.25:
-            score += 3
-        elif input_data.dscr >= 1.10:
-            score += 2
-        elif input_data.dscr >= 1.00:
-            score += 1
-
-        # Credit scoring
-        if input_data.credit_score >= 760:
-            score += 4
-        elif input_data.credit_score >= 740:
-            score += 3
-        elif input_data.credit_score >= 720:
-            score += 2
-        elif input_data.credit_score >= 700:
-            score += 1
-
-        # LTV scoring (inverse)
-        if input_data.ltv <= 65:
-            score += 4
-        elif input_data.ltv <= 70:
-            score += 3
-        elif input_data.ltv <= 75:
-            score += 2
-        elif input_data.ltv <= 80:
-            score += 1
+        index = self._risk_tier_index(input_data.dscr, input_data.ltv, input_data.credit_score)
+        return _TIERS[index]
+
+    def _risk_tier_index(self, dscr: float, ltv: float, credit_score: int) -> int:
+        """Index into _TIERS (0 = HIGH_RISK .. 4 = EXCELLENT) from DSCR, LTV and credit score."""
+        # Simple scoring based on key factors (NaN scores 0, like a failed comparison)
+        score = bisect_right(_CREDIT_SCORE_THRESH, credit_score)
+        if dscr == dscr:
+            score += bisect_right(_DSCR_SCORE_THRESH, dscr)
+        if ltv == ltv:
+            score += len(_LTV_SCORE_THRESH) - bisect_left(_LTV_SCORE_THRESH, ltv)
 
         # Map score to tier
-        if score >= 10:
-            return RiskTier.EXCELLENT
-        elif score >= 7:
-            return RiskTier.GOOD
-        elif score >= 4:
-            return RiskTier.ACCEPTABLE
-        elif score >= 2:
-            return RiskTier.MARGINAL
-        else:
-            return RiskTier.HIGH_RISK
+        return bisect_right(_TIER_THRESH, score)
 
     def _get_dscr_adjustment(self, dscr: float) -> int:
         """Get DSCR adjustment in basis points."""
-        for (low, high), adj in self.DSCR_ADJUSTMENTS.items():
-            if low <= dscr < high:
-                return adj
-        return 0
+        return _lookup_bin(self._DSCR_EDGES, self._DSCR_BPS, dscr, 0)
 
     def _get_ltv_adjustment(self, ltv: float) -> int:
         """Get LTV adjustment in basis points."""
-        for (low, high), adj in self.LTV_ADJUSTMENTS.items():
-            if low <= ltv < high:
-                return adj
-        return 0
+        return _lookup_bin(self._LTV_EDGES, self._LTV_BPS, ltv, 0)
 
     def _get_credit_adjustment(self, score: int) -> int | None:
         """Get credit score adjustment in basis points."""
-        for (low, high), adj in self.CREDIT_ADJUSTMENTS.items():
-            if low <= score < high:
-                return adj
-        return None
+        return _lookup_bin(self._CREDIT_EDGES, self._CREDIT_BPS, score, None)
 
 
 # Export singleton
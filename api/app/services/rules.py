@@ -5,12 +5,22 @@ Evaluates loan applications against underwriting guidelines.
 Supports DSCR-specific rules and investor overlays.
 """
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+if TYPE_CHECKING:
+    import numpy as np
+
+_ELIGIBLE_PROPERTY_TYPES = frozenset({
+    "SFR", "CONDO", "TOWNHOUSE", "DUPLEX", "TRIPLEX", "FOURPLEX",
+    "MULTIFAMILY_5PLUS", "2_4_UNIT", "MULTI_FAMILY",
+})
+_ELIGIBLE_PROPERTY_TYPE_FLAGS = dict.fromkeys(_ELIGIBLE_PROPERTY_TYPES, True)
+
 
 class RuleCategory(str, Enum):
     """Rule category."""
@@ -37,7 +47,7 @@ class RuleStatus(str, Enum):
     NOT_APPLICABLE = "NOT_APPLICABLE"
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleResult:
     """Individual rule evaluation result."""
     rule_id: str
@@ -50,7 +60,7 @@ class RuleResult:
     exception_eligible: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RulesEvaluationResult:
     """Complete rules evaluation result."""
     id: str
@@ -66,7 +76,7 @@ class RulesEvaluationResult:
     warning_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LoanData:
     """Loan data for rules evaluation."""
     application_id: str
@@ -88,41 +98,197 @@ class LoanData:
     owner_address_matches_property: bool = False  # True if mailing address = property address
 
 
+@dataclass(slots=True)
+class LoanDataBatch:
+    """Column-oriented LoanData for the batch paths: one NumPy array per field.
+
+    String fields (property_type, property_state, loan_purpose,
+    occupancy_type) are int32 codes into the shared labels tuple.
+    """
+    application_id: "np.ndarray"
+    dscr: "np.ndarray"
+    ltv: "np.ndarray"
+    cltv: "np.ndarray"
+    credit_score: "np.ndarray"
+    property_type: "np.ndarray"
+    property_state: "np.ndarray"
+    loan_amount: "np.ndarray"  # cents
+    loan_purpose: "np.ndarray"
+    occupancy_type: "np.ndarray"
+    units: "np.ndarray"
+    is_rural: "np.ndarray"
+    months_reserves: "np.ndarray"
+    prior_bankruptcies: "np.ndarray"
+    prior_foreclosures: "np.ndarray"
+    current_delinquencies: "np.ndarray"
+    owner_address_matches_property: "np.ndarray"
+    labels: tuple[str, ...] = ()
+
+    @classmethod
+    def from_records(cls, records: Sequence[LoanData]) -> "LoanDataBatch":
+        """Build typed column arrays from LoanData records."""
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is required for batch rule checks. Run: pip install numpy")
+
+        n = len(records)
+        label_ids: dict[str, int] = {}
+
+        def column(name: str, dtype: Any) -> "np.ndarray":
+            return np.fromiter((getattr(r, name) for r in records), dtype=dtype, count=n)
+
+        def codes(name: str) -> "np.ndarray":
+            return np.fromiter(
+                (label_ids.setdefault(getattr(r, name), len(label_ids)) for r in records),
+                dtype=np.int32,
+                count=n,
+            )
+
+        return cls(
+            application_id=np.array([r.application_id for r in records], dtype=object),
+            dscr=column("dscr", np.float64),
+            ltv=column("ltv", np.float64),
+            cltv=column("cltv", np.float64),
+            credit_score=column("credit_score", np.int64),
+            property_type=codes("property_type"),
+            property_state=codes("property_state"),
+            loan_amount=column("loan_amount", np.int64),
+            loan_purpose=codes("loan_purpose"),
+            occupancy_type=codes("occupancy_type"),
+            units=column("units", np.int64),
+            is_rural=column("is_rural", bool),
+            months_reserves=column("months_reserves", np.int64),
+            prior_bankruptcies=column("prior_bankruptcies", np.int64),
+            prior_foreclosures=column("prior_foreclosures", np.int64),
+            current_delinquencies=column("current_delinquencies", np.int64),
+            owner_address_matches_property=column("owner_address_matches_property", bool),
+            labels=tuple(label_ids),
+        )
+
+    def __len__(self) -> int:
+        return len(self.dscr)
+
+    def lookup(self, codes: "np.ndarray", table: Mapping[str, Any], default: Any) -> "np.ndarray":
+        """Map a coded string column through {label: value}, probing each label once."""
+        import numpy as np
+
+        return np.array([table.get(label, default) for label in self.labels])[codes]
+
+
 class RulesEngine:
     """DSCR loan rules engine."""
 
     def __init__(self) -> None:
         self.rules: list[dict[str, Any]] = self._init_rules()
+        self._compiled_rules = self._compile_rules(self.rules)
+        # Hard stops first (stable), so fail-fast evaluation can stop at the first decline
+        self._fail_fast_rules = tuple(
+            sorted(self._compiled_rules, key=lambda rule: rule[3] != RuleSeverity.HARD_STOP)
+        )
 
-    def evaluate(self, loan_data: LoanData) -> RulesEvaluationResult:
-        """Evaluate all rules against loan data."""
-        results: list[RuleResult] = []
+    def evaluate(self, loan_data: LoanData, fail_fast: bool = False) -> RulesEvaluationResult:
+        """Evaluate all rules against loan data.
+
+        With fail_fast, hard-stop rules run first and evaluation stops at the
+        first hard-stop failure; the remaining rules are left out of the result.
+        """
+        return self._evaluate(loan_data, str(uuid4()), datetime.utcnow(), fail_fast)
+
+    def evaluate_batch(
+        self, loan_datas: Sequence[LoanData], fail_fast: bool = False
+    ) -> list[RulesEvaluationResult]:
+        """Evaluate many loans, sharing one evaluation timestamp across the batch."""
+        now = datetime.utcnow()
+        return [
+            self._evaluate(loan_data, str(uuid4()), now, fail_fast) for loan_data in loan_datas
+        ]
+
+    def check_batch(self, batch: LoanDataBatch) -> "np.ndarray":
+        """Run every rule check over many loans at once (portfolio re-underwriting).
 
-        for rule in self.rules:
-            result = self._evaluate_rule(rule, loan_data)
-            results.append(result)
+        Returns a bool matrix of shape (len(batch), n_rules) whose column j is
+        the pass flag of self.rules[j], matching the scalar check for
+        well-formed values. Messages are left to evaluate() for the rows that
+        need them.
+        """
+        import numpy as np
 
-        # Categorize results
-        hard_stops = [r for r in results if r.status == RuleStatus.FAIL and r.severity == RuleSeverity.HARD_STOP]
-        exceptions_required = [r for r in results if r.status == RuleStatus.FAIL and r.severity == RuleSeverity.EXCEPTION_REQUIRED]
-        warnings = [r for r in results if r.status == RuleStatus.WARNING]
+        return np.column_stack(
+            [np.asarray(rule["batch_check"](batch), dtype=bool) for rule in self.rules]
+        )
+
+    def _evaluate(
+        self,
+        loan_data: LoanData,
+        result_id: str,
+        evaluated_at: datetime,
+        fail_fast: bool = False,
+    ) -> RulesEvaluationResult:
+        """Evaluate all rules against loan data, with the result id and timestamp given."""
+        # Enum members as locals; statuses and severities are always members, so compare by identity
+        status_pass, status_fail = RuleStatus.PASS, RuleStatus.FAIL
+        status_warning = RuleStatus.WARNING
+        hard_stop, exception_required = RuleSeverity.HARD_STOP, RuleSeverity.EXCEPTION_REQUIRED
+
+        results: list[RuleResult] = []
+        append = results.append
+
+        for (
+            rule_id, rule_name, category, severity, fail_status, exception_eligible,
+            check_fn, message_fn,
+        ) in self._fail_fast_rules if fail_fast else self._compiled_rules:
+            try:
+                passed = check_fn(loan_data)
+                status = status_pass if passed else fail_status
+                message = message_fn(loan_data, passed)
+            except Exception as e:
+                status = RuleStatus.NOT_APPLICABLE
+                message = f"Rule evaluation error: {str(e)}"
+
+            append(RuleResult(
+                rule_id=rule_id,
+                rule_name=rule_name,
+                category=category,
+                status=status,
+                severity=severity,
+                message=message,
+                exception_eligible=exception_eligible,
+            ))
+            if fail_fast and status is status_fail and severity is hard_stop:
+                break
+
+        # Categorize results in one pass
+        hard_stops: list[RuleResult] = []
+        exceptions_required: list[RuleResult] = []
+        warnings: list[RuleResult] = []
+        passed_count = failed_count = 0
+        for r in results:
+            status = r.status
+            if status is status_pass:
+                passed_count += 1
+            elif status is status_fail:
+                failed_count += 1
+                if r.severity is hard_stop:
+                    hard_stops.append(r)
+                elif r.severity is exception_required:
+                    exceptions_required.append(r)
+            elif status is status_warning:
+                warnings.append(r)
+        warning_count = len(warnings)
 
         # Determine overall status
         if hard_stops:
-            overall_status = RuleStatus.FAIL
+            overall_status = status_fail
         elif exceptions_required:
-            overall_status = RuleStatus.WARNING
+            overall_status = status_warning
         else:
-            overall_status = RuleStatus.PASS
-
-        passed_count = len([r for r in results if r.status == RuleStatus.PASS])
-        failed_count = len([r for r in results if r.status == RuleStatus.FAIL])
-        warning_count = len([r for r in results if r.status == RuleStatus.WARNING])
+            overall_status = status_pass
 
         return RulesEvaluationResult(
-            id=str(uuid4()),
+            id=result_id,
             application_id=loan_data.application_id,
-            evaluated_at=datetime.utcnow(),
+            evaluated_at=evaluated_at,
             overall_status=overall_status,
             rule_results=results,
             hard_stops=hard_stops,
@@ -133,33 +299,21 @@ class RulesEngine:
             warning_count=warning_count,
         )
 
-    def _evaluate_rule(self, rule: dict[str, Any], loan_data: LoanData) -> RuleResult:
-        """Evaluate a single rule."""
-        rule_id = rule["id"]
-        rule_name = rule["name"]
-        category = rule["category"]
-        severity = rule["severity"]
-        check_fn = rule["check"]
-        message_fn = rule["message"]
-
-        try:
-            passed = check_fn(loan_data)
-            status = RuleStatus.PASS if passed else (
-                RuleStatus.WARNING if severity == RuleSeverity.WARNING else RuleStatus.FAIL
+    @staticmethod
+    def _compile_rules(rules: list[dict[str, Any]]) -> tuple[tuple[Any, ...], ...]:
+        """Flatten rule dicts into tuples, resolving each rule's failing status up front."""
+        return tuple(
+            (
+                rule["id"],
+                rule["name"],
+                rule["category"],
+                rule["severity"],
+                RuleStatus.WARNING if rule["severity"] == RuleSeverity.WARNING else RuleStatus.FAIL,
+                rule["severity"] == RuleSeverity.EXCEPTION_REQUIRED,
+                rule["check"],
+                rule["message"],
             )
-            message = message_fn(loan_data, passed)
-        except Exception as e:
-            status = RuleStatus.NOT_APPLICABLE
-            message = f"Rule evaluation error: {str(e)}"
-
-        return RuleResult(
-            rule_id=rule_id,
-            rule_name=rule_name,
-            category=category,
-            status=status,
-            severity=severity,
-            message=message,
-            exception_eligible=severity == RuleSeverity.EXCEPTION_REQUIRED,
+            for rule in rules
         )
 
     def _init_rules(self) -> list[dict[str, Any]]:
@@ -173,6 +327,7 @@ class RulesEngine:
                 "severity": RuleSeverity.HARD_STOP,
                 "check": lambda d: d.dscr >= 0.75,
                 "message": lambda d, p: f"DSCR of {d.dscr:.2f} {'meets' if p else 'does not meet'} minimum 0.75 requirement",
+                "batch_check": lambda b: b.dscr >= 0.75,
             },
             {
                 "id": "DSCR-002",
@@ -181,6 +336,7 @@ class RulesEngine:
                 "severity": RuleSeverity.EXCEPTION_REQUIRED,
                 "check": lambda d: d.dscr >= 1.0,
                 "message": lambda d, p: f"DSCR of {d.dscr:.2f} is {'above' if p else 'below'} 1.0 threshold",
+                "batch_check": lambda b: b.dscr >= 1.0,
             },
 
             # LTV Rules
@@ -191,6 +347,7 @@ class RulesEngine:
                 "severity": RuleSeverity.HARD_STOP,
                 "check": lambda d: d.ltv <= 80,
                 "message": lambda d, p: f"LTV of {d.ltv:.1f}% {'is within' if p else 'exceeds'} 80% maximum",
+                "batch_check": lambda b: b.ltv <= 80,
             },
             {
                 "id": "LTV-002",
@@ -199,6 +356,7 @@ class RulesEngine:
                 "severity": RuleSeverity.WARNING,
                 "check": lambda d: d.ltv <= 75,
                 "message": lambda d, p: f"LTV of {d.ltv:.1f}% {'is' if p else 'is not'} within preferred 75% threshold",
+                "batch_check": lambda b: b.ltv <= 75,
             },
 
             # Credit Rules
@@ -209,6 +367,7 @@ class RulesEngine:
                 "severity": RuleSeverity.HARD_STOP,
                 "check": lambda d: d.credit_score >= 660,
                 "message": lambda d, p: f"Credit score of {d.credit_score} {'meets' if p else 'does not meet'} minimum 660 requirement",
+                "batch_check": lambda b: b.credit_score >= 660,
             },
             {
                 "id": "CREDIT-002",
@@ -217,6 +376,7 @@ class RulesEngine:
                 "severity": RuleSeverity.WARNING,
                 "check": lambda d: d.credit_score >= 700,
                 "message": lambda d, p: f"Credit score of {d.credit_score} {'is' if p else 'is not'} above preferred 700 threshold",
+                "batch_check": lambda b: b.credit_score >= 700,
             },
             {
                 "id": "CREDIT-003",
@@ -225,6 +385,7 @@ class RulesEngine:
                 "severity": RuleSeverity.WARNING,
                 "check": lambda d: d.prior_bankruptcies == 0,
                 "message": lambda d, p: "No bankruptcy history" if p else f"Borrower has {d.prior_bankruptcies} prior bankruptcy(ies) - review seasoning",
+                "batch_check": lambda b: b.prior_bankruptcies == 0,
             },
             {
                 "id": "CREDIT-004",
@@ -233,6 +394,7 @@ class RulesEngine:
                 "severity": RuleSeverity.WARNING,
                 "check": lambda d: d.prior_foreclosures == 0,
                 "message": lambda d, p: "No foreclosure history" if p else f"Borrower has {d.prior_foreclosures} prior foreclosure(s) - review seasoning",
+                "batch_check": lambda b: b.prior_foreclosures == 0,
             },
 
             # Property Rules
@@ -241,8 +403,11 @@ class RulesEngine:
                 "name": "Eligible Property Type",
                 "category": RuleCategory.PROPERTY,
                 "severity": RuleSeverity.WARNING,
-                "check": lambda d: d.property_type in ["SFR", "CONDO", "TOWNHOUSE", "DUPLEX", "TRIPLEX", "FOURPLEX", "MULTIFAMILY_5PLUS", "2_4_UNIT", "MULTI_FAMILY"],
+                "check": lambda d: d.property_type in _ELIGIBLE_PROPERTY_TYPES,
                 "message": lambda d, p: f"Property type {d.property_type} {'is' if p else 'is not'} in standard eligible list - review required",
+                "batch_check": lambda b: b.lookup(
+                    b.property_type, _ELIGIBLE_PROPERTY_TYPE_FLAGS, False
+                ),
             },
             {
                 "id": "PROP-002",
@@ -251,6 +416,7 @@ class RulesEngine:
                 "severity": RuleSeverity.WARNING,
                 "check": lambda d: not d.is_rural,
                 "message": lambda d, p: "Property is not in a rural area" if p else "Property is in a rural area - review required",
+                "batch_check": lambda b: ~b.is_rural,
             },
             {
                 "id": "PROP-003",
@@ -259,6 +425,7 @@ class RulesEngine:
                 "severity": RuleSeverity.WARNING,
                 "check": lambda d: not d.owner_address_matches_property,
                 "message": lambda d, p: "Owner mailing address differs from property" if p else "Owner mailing address matches property - may be owner-occupied, verify investment use",
+                "batch_check": lambda b: ~b.owner_address_matches_property,
             },
 
             # Loan Amount Rules
@@ -269,6 +436,7 @@ class RulesEngine:
                 "severity": RuleSeverity.HARD_STOP,
                 "check": lambda d: d.loan_amount >= 10000000,  # $100,000
                 "message": lambda d, p: f"Loan amount ${d.loan_amount / 100:,.0f} {'meets' if p else 'does not meet'} minimum $100,000",
+                "batch_check": lambda b: b.loan_amount >= 10000000,
             },
             {
                 "id": "LOAN-002",
@@ -277,6 +445,7 @@ class RulesEngine:
                 "severity": RuleSeverity.HARD_STOP,
                 "check": lambda d: d.loan_amount <= 300000000,  # $3,000,000
                 "message": lambda d, p: f"Loan amount ${d.loan_amount / 100:,.0f} {'is within' if p else 'exceeds'} maximum $3,000,000",
+                "batch_check": lambda b: b.loan_amount <= 300000000,
             },
 
             # Reserve Rules - removed (requires manual verification of borrower assets)
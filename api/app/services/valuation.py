@@ -10,13 +10,18 @@ DSCR Valuation Strategy:
 - AVM cascade: Primary → Secondary → Tertiary vendors
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from app.adapters.datatree import datatree_avm, Address, AVMReport
+from app.adapters.datatree import Address, AVMReport, datatree_avm
+from app.utils import TTLCache
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ValuationType(str, Enum):
@@ -38,7 +43,7 @@ class ValuationStatus(str, Enum):
     EXPIRED = "EXPIRED"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValuationOrder:
     """Valuation order."""
     id: str
@@ -55,7 +60,7 @@ class ValuationOrder:
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AVMCascadeResult:
     """Result of AVM cascade."""
     success: bool
@@ -73,6 +78,16 @@ class ValuationService:
     # AVM vendors in cascade order
     AVM_CASCADE = ["DataTree"]  # Add more vendors here
 
+    # Successful AVM results are reused per vendor and address for a while
+    AVM_CACHE_TTL_SECONDS = 3600
+    AVM_CACHE_MAX_ENTRIES = 4096
+
+    def __init__(self) -> None:
+        # (vendor, street, unit, city, state, zip) -> vendor result
+        self._avm_cache: TTLCache[tuple[str, ...], dict[str, Any]] = TTLCache(
+            self.AVM_CACHE_TTL_SECONDS, self.AVM_CACHE_MAX_ENTRIES
+        )
+
     async def order_avm(self, application_id: str, address: Address) -> ValuationOrder:
         """Order an AVM valuation with cascade fallback."""
         order = ValuationOrder(
@@ -100,14 +115,24 @@ class ValuationService:
         return order
 
     async def _run_avm_cascade(self, address: Address) -> AVMCascadeResult:
-        """Run AVM cascade through vendors until success."""
-        result = AVMCascadeResult(success=False)
+        """Run AVM cascade through vendors until success.
 
-        for vendor_name in self.AVM_CASCADE:
-            result.cascade_attempts += 1
-
-            if vendor_name == "DataTree":
-                avm_result = await datatree_avm.order_avm(address)
+        All vendors are ordered concurrently, but results are taken in cascade
+        order, so the first successful vendor in AVM_CASCADE still wins; the
+        remaining requests are cancelled.
+        """
+        result = AVMCascadeResult(success=False)
+        tasks = [
+            asyncio.create_task(self._call_avm_vendor(vendor_name, address))
+            for vendor_name in self.AVM_CASCADE
+        ]
+
+        try:
+            for vendor_name, task in zip(self.AVM_CASCADE, tasks):
+                result.cascade_attempts += 1
+                avm_result = await task
+                if avm_result is None:
+                    continue
 
                 if avm_result.get("success") and avm_result.get("report"):
                     report = avm_result["report"]
@@ -119,9 +144,44 @@ class ValuationService:
                     break
                 else:
                     result.errors.append(avm_result.get("error", {"message": "Unknown error"}))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         return result
 
+    async def _call_avm_vendor(self, vendor_name: str, address: Address) -> dict[str, Any] | None:
+        """Order an AVM from one vendor; None for vendors without an adapter.
+
+        Successful results are cached per normalized address, so pipeline
+        re-runs don't pay for the same AVM twice.
+        """
+        key = (vendor_name, *self._address_key(address))
+        cached = self._avm_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if vendor_name == "DataTree":
+            avm_result = await datatree_avm.order_avm(address)
+        else:
+            return None
+
+        if avm_result.get("success") and avm_result.get("report"):
+            self._avm_cache.put(key, avm_result)
+        return avm_result
+
+    @staticmethod
+    def _address_key(address: Address) -> tuple[str, str, str, str, str]:
+        """Normalized (street, unit, city, state, zip) used as the AVM cache key."""
+        return (
+            address.street.upper().strip(),
+            (address.unit or "").upper().strip(),
+            address.city.upper().strip(),
+            address.state.upper().strip(),
+            address.zip_code.upper().strip(),
+        )
+
     async def get_valuation(self, order_id: str) -> ValuationOrder | None:
         """Get valuation order by ID."""
         # In production, this would query the database
@@ -150,6 +210,39 @@ class ValuationService:
             "recommended_value": appraisal_value,  # Always use appraisal for final
         }
 
+    def reconcile_values_batch(
+        self,
+        avm_values: Any,
+        appraisal_values: Any,
+        tolerance: float = 0.10,
+    ) -> dict[str, "np.ndarray"]:
+        """Reconcile many AVM/appraisal pairs at once (portfolio reviews).
+
+        Returns arrays matching reconcile_values() row by row. Rows with a zero
+        appraisal get NaN variance, reconciled=False and an empty direction.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is required for batch reconciliation. Run: pip install numpy")
+
+        avm = np.asarray(avm_values, dtype=np.float64)
+        appraisal = np.asarray(appraisal_values, dtype=np.float64)
+        valid = appraisal != 0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = np.where(valid, (avm - appraisal) / appraisal, np.nan)
+        variance_pct = np.abs(variance * 100)
+        within_tolerance = variance_pct <= tolerance * 100  # NaN rows compare False
+
+        return {
+            "reconciled": within_tolerance,
+            "variance_pct": np.round(variance_pct, 2),
+            "variance_direction": np.where(valid, np.where(variance > 0, "over", "under"), ""),
+            "within_tolerance": within_tolerance,
+            "recommended_value": np.asarray(appraisal_values),  # Always use appraisal for final
+        }
+
 
 # Export singleton
 valuation_service = ValuationService()
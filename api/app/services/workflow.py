@@ -4,9 +4,11 @@ Workflow Engine
 Manages loan lifecycle and milestone transitions for DSCR loans.
 """
 
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import chain
 from typing import Any
 from uuid import uuid4
 
@@ -55,7 +57,7 @@ class TaskPriority(str, Enum):
     URGENT = "URGENT"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Workflow task."""
     id: str
@@ -72,7 +74,7 @@ class Task:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class MilestoneTransition:
     """Record of milestone transition."""
     id: str
@@ -85,18 +87,18 @@ class MilestoneTransition:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowState:
-    """Current workflow state for an application."""
+    """Current workflow state for an application (shared via the get_state cache)."""
     application_id: str
     current_milestone: Milestone
     entered_milestone_at: datetime
     days_in_milestone: float
-    pending_tasks: list[Task]
-    completed_tasks: list[Task]
+    pending_tasks: tuple[Task, ...]
+    completed_tasks: tuple[Task, ...]
     sla_status: str  # ON_TRACK, AT_RISK, BREACHED
-    next_milestones: list[Milestone]
-    blockers: list[str]
+    next_milestones: tuple[Milestone, ...]
+    blockers: tuple[str, ...]
 
 
 # SLA hours by milestone
@@ -113,28 +115,36 @@ MILESTONE_SLA = {
     Milestone.CLEAR_TO_CLOSE: 24,
     Milestone.CLOSING: 48,
 }
+DEFAULT_SLA_HOURS = 48  # milestones without an SLA entry
+
+# SLA thresholds in seconds: breached past the SLA, at risk past 75% of it
+MILESTONE_SLA_SECONDS = {m: hours * 3600 for m, hours in MILESTONE_SLA.items()}
+MILESTONE_SLA_AT_RISK_SECONDS = {m: hours * 2700 for m, hours in MILESTONE_SLA.items()}
 
 # Valid milestone transitions
 VALID_TRANSITIONS = {
-    Milestone.LEADS: [Milestone.LEADS_VERIFIED, Milestone.WITHDRAWN],
-    Milestone.LEADS_VERIFIED: [Milestone.CONTACTED, Milestone.WITHDRAWN],
-    Milestone.CONTACTED: [Milestone.REACHED_LANDING, Milestone.WITHDRAWN],
-    Milestone.REACHED_LANDING: [Milestone.VERIFIED_INFO, Milestone.WITHDRAWN],
-    Milestone.VERIFIED_INFO: [Milestone.STARTED, Milestone.FUNDED, Milestone.WITHDRAWN],
-    Milestone.STARTED: [Milestone.APPLICATION, Milestone.WITHDRAWN],
-    Milestone.APPLICATION: [Milestone.PRE_APPROVED, Milestone.DENIED, Milestone.WITHDRAWN],
-    Milestone.PRE_APPROVED: [Milestone.PROCESSING, Milestone.DENIED, Milestone.WITHDRAWN],
-    Milestone.PROCESSING: [Milestone.SUBMITTED, Milestone.DENIED, Milestone.WITHDRAWN],
-    Milestone.SUBMITTED: [Milestone.CONDITIONALLY_APPROVED, Milestone.DENIED, Milestone.WITHDRAWN],
-    Milestone.CONDITIONALLY_APPROVED: [Milestone.APPROVED, Milestone.DENIED, Milestone.WITHDRAWN],
-    Milestone.APPROVED: [Milestone.DOCS_OUT, Milestone.WITHDRAWN],
-    Milestone.DOCS_OUT: [Milestone.DOCS_BACK, Milestone.WITHDRAWN],
-    Milestone.DOCS_BACK: [Milestone.CLEAR_TO_CLOSE, Milestone.WITHDRAWN],
-    Milestone.CLEAR_TO_CLOSE: [Milestone.CLOSING, Milestone.WITHDRAWN],
-    Milestone.CLOSING: [Milestone.FUNDED, Milestone.WITHDRAWN],
-    Milestone.FUNDED: [Milestone.COMPLETION],
+    Milestone.LEADS: (Milestone.LEADS_VERIFIED, Milestone.WITHDRAWN),
+    Milestone.LEADS_VERIFIED: (Milestone.CONTACTED, Milestone.WITHDRAWN),
+    Milestone.CONTACTED: (Milestone.REACHED_LANDING, Milestone.WITHDRAWN),
+    Milestone.REACHED_LANDING: (Milestone.VERIFIED_INFO, Milestone.WITHDRAWN),
+    Milestone.VERIFIED_INFO: (Milestone.STARTED, Milestone.FUNDED, Milestone.WITHDRAWN),
+    Milestone.STARTED: (Milestone.APPLICATION, Milestone.WITHDRAWN),
+    Milestone.APPLICATION: (Milestone.PRE_APPROVED, Milestone.DENIED, Milestone.WITHDRAWN),
+    Milestone.PRE_APPROVED: (Milestone.PROCESSING, Milestone.DENIED, Milestone.WITHDRAWN),
+    Milestone.PROCESSING: (Milestone.SUBMITTED, Milestone.DENIED, Milestone.WITHDRAWN),
+    Milestone.SUBMITTED: (Milestone.CONDITIONALLY_APPROVED, Milestone.DENIED, Milestone.WITHDRAWN),
+    Milestone.CONDITIONALLY_APPROVED: (Milestone.APPROVED, Milestone.DENIED, Milestone.WITHDRAWN),
+    Milestone.APPROVED: (Milestone.DOCS_OUT, Milestone.WITHDRAWN),
+    Milestone.DOCS_OUT: (Milestone.DOCS_BACK, Milestone.WITHDRAWN),
+    Milestone.DOCS_BACK: (Milestone.CLEAR_TO_CLOSE, Milestone.WITHDRAWN),
+    Milestone.CLEAR_TO_CLOSE: (Milestone.CLOSING, Milestone.WITHDRAWN),
+    Milestone.CLOSING: (Milestone.FUNDED, Milestone.WITHDRAWN),
+    Milestone.FUNDED: (Milestone.COMPLETION,),
 }
 
+# Same transitions as sets for O(1) validation in transition()
+VALID_TRANSITIONS_SET = {k: frozenset(v) for k, v in VALID_TRANSITIONS.items()}
+
 # Tasks generated at each milestone
 MILESTONE_TASKS = {
     Milestone.STARTED: [
@@ -175,51 +185,100 @@ MILESTONE_TASKS = {
     ],
 }
 
+# MILESTONE_TASKS expanded once: (title, description, role, sla_hours, sla timedelta)
+MILESTONE_TASK_TEMPLATES = {
+    milestone: tuple(
+        (
+            title,
+            f"Task for {milestone.value} milestone",
+            role,
+            sla_hours,
+            timedelta(hours=sla_hours),
+        )
+        for title, role, sla_hours in tasks
+    )
+    for milestone, tasks in MILESTONE_TASKS.items()
+}
+
 
 class WorkflowEngine:
     """Workflow management engine."""
 
+    # get_state results are reused until the application changes or the minute rolls over
+    STATE_CACHE_MAX_ENTRIES = 1024
+
     def __init__(self) -> None:
         # In-memory storage for demo
-        self._transitions: dict[str, list[MilestoneTransition]] = {}
-        self._tasks: dict[str, list[Task]] = {}
+        self._transitions: defaultdict[str, list[MilestoneTransition]] = defaultdict(list)
+        self._tasks: defaultdict[str, list[Task]] = defaultdict(list)
+        # Latest time each application entered each milestone
+        self._entered_at: dict[str, dict[Milestone, datetime]] = {}
+        # All tasks by id, for O(1) lookup in complete_task
+        self._task_index: dict[str, Task] = {}
+        # Not-yet-completed and completed tasks per application (task id -> Task,
+        # insertion-ordered), maintained by update_task_status
+        self._pending_tasks: dict[str, dict[str, Task]] = {}
+        self._completed_tasks: dict[str, dict[str, Task]] = {}
+        # Bumped on every write to an application; part of the get_state cache key
+        self._version: dict[str, int] = {}
+        self._state_cache: OrderedDict[tuple[Any, ...], WorkflowState] = OrderedDict()
 
     def get_state(self, application_id: str, current_milestone: Milestone) -> WorkflowState:
-        """Get current workflow state."""
-        transitions = self._transitions.get(application_id, [])
-        tasks = self._tasks.get(application_id, [])
+        """Get current workflow state.
+
+        Results are cached per (application, milestone, write version, minute),
+        so repeated polls are cheap; SLA fields may lag by up to a minute.
+        Change task status through update_task_status so the cached state is
+        refreshed immediately. The state is immutable, so callers can share it.
+        """
+        now = datetime.utcnow()
+        cache_key = (
+            application_id,
+            current_milestone,
+            self._version.get(application_id, 0),
+            now.replace(second=0, microsecond=0),
+        )
+        state_cache = self._state_cache
+        cached = state_cache.get(cache_key)
+        if cached is not None:
+            state_cache.move_to_end(cache_key)
+            return cached
 
         # Find when we entered current milestone
-        entered_at = datetime.utcnow()
-        for t in reversed(transitions):
-            if t.to_milestone == current_milestone:
-                entered_at = t.transitioned_at
-                break
+        entered_at = self._entered_at.get(application_id, {}).get(current_milestone, now)
 
-        days_in_milestone = (datetime.utcnow() - entered_at).total_seconds() / 86400
+        elapsed_seconds = (now - entered_at).total_seconds()
+        days_in_milestone = elapsed_seconds / 86400
 
         # Get SLA status
-        sla_hours = MILESTONE_SLA.get(current_milestone, 48)
-        if days_in_milestone * 24 > sla_hours:
+        if elapsed_seconds > MILESTONE_SLA_SECONDS.get(current_milestone, DEFAULT_SLA_HOURS * 3600):
             sla_status = "BREACHED"
-        elif days_in_milestone * 24 > sla_hours * 0.75:
+        elif elapsed_seconds > MILESTONE_SLA_AT_RISK_SECONDS.get(
+            current_milestone, DEFAULT_SLA_HOURS * 2700
+        ):
             sla_status = "AT_RISK"
         else:
             sla_status = "ON_TRACK"
 
-        # Get pending/completed tasks
-        pending_tasks = [t for t in tasks if t.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]]
-        completed_tasks = [t for t in tasks if t.status == TaskStatus.COMPLETED]
+        # Get pending (creation order) / completed (completion order) tasks,
+        # checking current status in case a task was changed outside the engine
+        open_tasks = self._pending_tasks.get(application_id, {}).values()
+        done_tasks = self._completed_tasks.get(application_id, {}).values()
+        pending_tasks = tuple(
+            t for t in chain(open_tasks, done_tasks)
+            if t.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]
+        )
+        completed_tasks = tuple(
+            t for t in chain(done_tasks, open_tasks) if t.status == TaskStatus.COMPLETED
+        )
 
         # Get valid next milestones
-        next_milestones = VALID_TRANSITIONS.get(current_milestone, [])
+        next_milestones = VALID_TRANSITIONS.get(current_milestone, ())
 
         # Identify blockers
-        blockers = []
-        if pending_tasks:
-            blockers.append(f"{len(pending_tasks)} pending tasks")
+        blockers = (f"{len(pending_tasks)} pending tasks",) if pending_tasks else ()
 
-        return WorkflowState(
+        state = WorkflowState(
             application_id=application_id,
             current_milestone=current_milestone,
             entered_milestone_at=entered_at,
@@ -231,6 +290,11 @@ class WorkflowEngine:
             blockers=blockers,
         )
 
+        state_cache[cache_key] = state
+        if len(state_cache) > self.STATE_CACHE_MAX_ENTRIES:
+            state_cache.popitem(last=False)
+        return state
+
     def transition(
         self,
         application_id: str,
@@ -242,64 +306,131 @@ class WorkflowEngine:
         """Record a milestone transition."""
         # Validate transition
         if from_milestone:
-            valid_next = VALID_TRANSITIONS.get(from_milestone, [])
-            if to_milestone not in valid_next:
+            if to_milestone not in VALID_TRANSITIONS_SET.get(from_milestone, frozenset()):
                 raise ValueError(f"Invalid transition from {from_milestone} to {to_milestone}")
 
+        now = datetime.utcnow()
         transition = MilestoneTransition(
-            id=str(uuid4()),
+            id=uuid4().hex,
             application_id=application_id,
             from_milestone=from_milestone,
             to_milestone=to_milestone,
-            transitioned_at=datetime.utcnow(),
+            transitioned_at=now,
             transitioned_by=transitioned_by,
             reason=reason,
         )
 
         # Store transition
-        if application_id not in self._transitions:
-            self._transitions[application_id] = []
         self._transitions[application_id].append(transition)
+        self._entered_at.setdefault(application_id, {})[to_milestone] = transition.transitioned_at
+        self._version[application_id] = self._version.get(application_id, 0) + 1
 
         # Generate tasks for new milestone
-        self._generate_milestone_tasks(application_id, to_milestone)
+        self._generate_milestone_tasks(application_id, to_milestone, now)
 
         return transition
 
-    def _generate_milestone_tasks(self, application_id: str, milestone: Milestone) -> None:
-        """Generate tasks for a milestone."""
-        task_templates = MILESTONE_TASKS.get(milestone, [])
-
-        if application_id not in self._tasks:
-            self._tasks[application_id] = []
-
-        for title, role, sla_hours in task_templates:
-            task = Task(
-                id=str(uuid4()),
+    def transition_many(
+        self,
+        updates: list[tuple[str, Milestone | None, Milestone, str, str | None]],
+    ) -> list[MilestoneTransition]:
+        """Record many milestone transitions at once.
+
+        Each update is (application_id, from_milestone, to_milestone,
+        transitioned_by, reason). All updates are validated before anything is
+        stored, so an invalid row rejects the whole batch. Rows are applied in
+        order and share one timestamp.
+        """
+        for _, from_milestone, to_milestone, _, _ in updates:
+            if from_milestone:
+                if to_milestone not in VALID_TRANSITIONS_SET.get(from_milestone, frozenset()):
+                    raise ValueError(
+                        f"Invalid transition from {from_milestone} to {to_milestone}"
+                    )
+
+        now = datetime.utcnow()
+        transitions = [
+            MilestoneTransition(
+                id=uuid4().hex,
+                application_id=application_id,
+                from_milestone=from_milestone,
+                to_milestone=to_milestone,
+                transitioned_at=now,
+                transitioned_by=transitioned_by,
+                reason=reason,
+            )
+            for application_id, from_milestone, to_milestone, transitioned_by, reason in updates
+        ]
+
+        for transition in transitions:
+            application_id = transition.application_id
+            self._transitions[application_id].append(transition)
+            self._entered_at.setdefault(application_id, {})[transition.to_milestone] = now
+            self._version[application_id] = self._version.get(application_id, 0) + 1
+
+        for transition in transitions:
+            self._generate_milestone_tasks(transition.application_id, transition.to_milestone, now)
+
+        return transitions
+
+    def _generate_milestone_tasks(
+        self, application_id: str, milestone: Milestone, now: datetime | None = None
+    ) -> None:
+        """Generate tasks for a milestone, created at `now` (default: current time)."""
+        task_templates = MILESTONE_TASK_TEMPLATES.get(milestone, ())
+
+        if now is None:
+            now = datetime.utcnow()
+        new_tasks = [
+            Task(
+                id=uuid4().hex,
                 application_id=application_id,
                 title=title,
-                description=f"Task for {milestone.value} milestone",
+                description=description,
                 status=TaskStatus.PENDING,
                 priority=TaskPriority.MEDIUM,
                 assigned_role=role,
                 sla_hours=sla_hours,
-                due_at=datetime.utcnow() + timedelta(hours=sla_hours),
+                due_at=now + sla_delta,
+                created_at=now,
             )
-            self._tasks[application_id].append(task)
+            for title, description, role, sla_hours, sla_delta in task_templates
+        ]
+        self._tasks[application_id].extend(new_tasks)
+        self._task_index.update((task.id, task) for task in new_tasks)
+        self._pending_tasks.setdefault(application_id, {}).update(
+            (task.id, task) for task in new_tasks
+        )
 
     def complete_task(self, application_id: str, task_id: str) -> Task | None:
         """Mark a task as complete."""
-        tasks = self._tasks.get(application_id, [])
-        for task in tasks:
-            if task.id == task_id:
-                task.status = TaskStatus.COMPLETED
-                task.completed_at = datetime.utcnow()
-                return task
-        return None
-
-    def get_tasks(self, application_id: str) -> list[Task]:
-        """Get all tasks for an application."""
-        return self._tasks.get(application_id, [])
+        return self.update_task_status(application_id, task_id, TaskStatus.COMPLETED)
+
+    def update_task_status(
+        self,
+        application_id: str,
+        task_id: str,
+        status: TaskStatus,
+    ) -> Task | None:
+        """Set a task's status, keeping the task indexes and cached state current."""
+        task = self._task_index.get(task_id)
+        if task is None or task.application_id != application_id:
+            return None
+        task.status = status
+        if status == TaskStatus.COMPLETED:
+            task.completed_at = datetime.utcnow()
+            self._pending_tasks.get(application_id, {}).pop(task_id, None)
+            self._completed_tasks.setdefault(application_id, {})[task_id] = task
+        elif self._completed_tasks.get(application_id, {}).pop(task_id, None) is not None:
+            task.completed_at = None
+            self._pending_tasks.setdefault(application_id, {})[task_id] = task
+        self._version[application_id] = self._version.get(application_id, 0) + 1
+        return task
+
+    def get_tasks(self, application_id: str) -> tuple[Task, ...]:
+        """Get all tasks for an application, as a snapshot the caller cannot mutate."""
+        tasks = self._tasks.get(application_id)
+        return tuple(tasks) if tasks else ()
 
 
 # Export singleton
@@ -0,0 +1,7 @@
+"""Shared helpers."""
+
+from app.utils.cache import TTLCache
+
+__all__ = [
+    "TTLCache",
+]
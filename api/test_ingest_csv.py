@@ -0,0 +1,105 @@
+"""
+CSV ingest parsing checks — the chunked pandas path must match csv.DictReader.
+Usage: pytest test_ingest_csv.py
+"""
+
+import pytest
+
+from app.services.ingest import IngestConfig, IngestService
+
+CSV_WITH_BLANKS = (
+    "first_name,last_name,email,phone,address,propertyreach_url,loan_amount\n"
+    "Ann,Lee,ann@example.com,,,,\n"
+    " \n"
+    "Bo,Li,bo@example.com, 555-0100 ,1 Main St,https://app.propertyreach.com/p/1,\"$1,250.50\"\n"
+)
+
+# Rows end with a delimiter the header does not have
+CSV_TRAILING_COMMAS = (
+    "first_name,last_name,email,loan_amount\n"
+    "Ann,Lee,ann@example.com,1000,\n"
+    "Bo,Li,bo@example.com,2000,\n"
+    "Cy,Ng,cy@example.com,3000,\n"
+)
+
+# Unquoted "$450,000.00" splits into an extra field on some rows
+CSV_EXTRA_FIELDS = (
+    "first_name,last_name,email,loan_amount,zip\n"
+    "Ann,Lee,ann@example.com,2000,78701\n"
+    "Bo,Li,bo@example.com,$450,000.00,78702\n"
+    "Cy,Ng,cy@example.com,3000,78703\n"
+)
+
+# DictReader keeps the last column for a repeated header; pandas would rename it "email.1"
+CSV_DUPLICATE_HEADERS = (
+    "first_name,last_name,email,email,zip\n"
+    "Ann,Lee,,ann@example.com,78701\n"
+    "Bo,Li,bo@example.com,bo2@example.com,78702\n"
+)
+
+
+def _assert_matches_dictreader(content):
+    pytest.importorskip("pandas")
+    service = IngestService(IngestConfig(csv_chunksize=2))
+
+    leads = service._parse_csv(content)
+    expected = service._parse_csv_rows(content)
+
+    assert [lead.row_number for lead in leads] == [lead.row_number for lead in expected]
+    assert leads == expected
+    return leads
+
+
+def test_blank_optional_cells_are_none():
+    leads = _assert_matches_dictreader(CSV_WITH_BLANKS)
+
+    blank = leads[0]
+    assert blank.phone is None
+    assert blank.property_address is None
+    assert blank.propertyreach_url is None
+    assert blank.loan_amount is None
+    assert leads[1].row_number == 4
+    assert leads[1].phone == "555-0100"
+    assert leads[1].loan_amount == 125050
+
+
+def test_blank_optional_cells_pandas_path():
+    leads = _assert_matches_dictreader(CSV_WITH_BLANKS.replace(" \n", ""))
+
+    assert leads[0].propertyreach_url is None
+    assert leads[0].phone is None
+
+
+def test_trailing_commas():
+    leads = _assert_matches_dictreader(CSV_TRAILING_COMMAS)
+
+    assert [lead.row_number for lead in leads] == [2, 3, 4]
+    assert [lead.loan_amount for lead in leads] == [100000, 200000, 300000]
+
+
+def test_rows_with_extra_fields():
+    leads = _assert_matches_dictreader(CSV_EXTRA_FIELDS)
+
+    assert [lead.row_number for lead in leads] == [2, 3, 4]
+    assert [lead.property_zip for lead in leads] == ["78701", "000.00", "78703"]
+
+
+def test_duplicate_headers():
+    leads = _assert_matches_dictreader(CSV_DUPLICATE_HEADERS)
+
+    assert [lead.email for lead in leads] == ["ann@example.com", "bo2@example.com"]
+
+
+def test_required_field_filter_keeps_row_numbers_across_chunks():
+    content = (
+        "first_name,last_name,email,phone\n"
+        "Ann,Lee,,555-0100,\n"
+        "Bo,Li,bo@example.com,,\n"
+        ",Ng,cy@example.com,555-0102,\n"
+        "Di,Wu,di@example.com,555-0103,\n"
+        "Ed,Ho,ed@example.com\n"
+    )
+    leads = _assert_matches_dictreader(content)
+
+    assert [lead.row_number for lead in leads] == [3, 5, 6]
+    assert [lead.phone for lead in leads] == [None, "555-0103", None]
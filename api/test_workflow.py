@@ -0,0 +1,52 @@
+"""
+Workflow engine checks — task status changes must reach the cached workflow state.
+Usage: pytest test_workflow.py
+"""
+
+from app.services.workflow import Milestone, TaskStatus, WorkflowEngine
+
+
+def _engine_with_tasks():
+    engine = WorkflowEngine()
+    engine.transition("app-1", None, Milestone.STARTED, "user-1")
+    tasks = engine.get_tasks("app-1")
+    assert len(tasks) >= 2
+    return engine, tasks
+
+
+def test_cancelled_task_is_not_pending():
+    engine, tasks = _engine_with_tasks()
+    state = engine.get_state("app-1", Milestone.STARTED)
+    assert tasks[0] in state.pending_tasks
+
+    engine.update_task_status("app-1", tasks[0].id, TaskStatus.CANCELLED)
+    state = engine.get_state("app-1", Milestone.STARTED)
+
+    assert tasks[0] not in state.pending_tasks
+    assert tasks[0] not in state.completed_tasks
+    assert state.blockers == (f"{len(tasks) - 1} pending tasks",)
+
+
+def test_task_cancelled_outside_engine_is_not_pending():
+    engine, tasks = _engine_with_tasks()
+
+    tasks[0].status = TaskStatus.CANCELLED
+    state = engine.get_state("app-1", Milestone.STARTED)
+
+    assert tasks[0] not in state.pending_tasks
+    assert state.blockers == (f"{len(tasks) - 1} pending tasks",)
+
+
+def test_completed_and_reopened_task():
+    engine, tasks = _engine_with_tasks()
+
+    engine.complete_task("app-1", tasks[0].id)
+    state = engine.get_state("app-1", Milestone.STARTED)
+    assert state.completed_tasks == (tasks[0],)
+    assert tasks[0] not in state.pending_tasks
+
+    engine.update_task_status("app-1", tasks[0].id, TaskStatus.IN_PROGRESS)
+    state = engine.get_state("app-1", Milestone.STARTED)
+    assert state.completed_tasks == ()
+    assert tasks[0] in state.pending_tasks
+    assert tasks[0].completed_at is None